@@ -2,24 +2,390 @@
 GitHub GraphQL API client for the GitHub Projects V2 MCP Server.
 """
 
+import asyncio
+import json
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
-from dotenv import load_dotenv
-import os
+try:  # orjson is an optional, faster drop-in for (de)serializing GraphQL payloads
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
 
-# Load variables from .env into environment
-load_dotenv()
+    _json_loads = json.loads
 
-# Access them
 
 logger = logging.getLogger(__name__)
 
 
+# ProjectV2FieldValue input key for each updatable ProjectV2 field dataType
+_DATA_TYPE_VALUE_KEYS = {
+    "TEXT": "text",
+    "DATE": "date",
+    "SINGLE_SELECT": "singleSelectOptionId",
+    "ITERATION": "iterationId",
+}
+
+
+# GraphQL documents, built once at import time so every request for the same
+# operation sends an identical query string and only the variables change.
+_Q_GET_OWNER_TYPE = """
+query GetOwnerType($login: String!) {
+  organization(login: $login) {
+    id
+    login
+    __typename
+  }
+  user(login: $login) {
+    id
+    login
+    __typename
+  }
+}
+"""
+
+_Q_GET_ORG_PROJECTS = """
+query GetOrgProjects($login: String!, $first: Int!) {
+  organization(login: $login) {
+    projectsV2(first: $first) {
+      nodes {
+        id
+        number
+        title
+        shortDescription
+        url
+        closed
+        public
+      }
+    }
+  }
+}
+"""
+
+_Q_GET_USER_PROJECTS = """
+query GetUserProjects($login: String!, $first: Int!) {
+  user(login: $login) {
+    projectsV2(first: $first) {
+      nodes {
+        id
+        number
+        title
+        shortDescription
+        url
+        closed
+        public
+      }
+    }
+  }
+}
+"""
+
+_Q_GET_PROJECT_ID = """
+query GetProjectId($login: String!, $number: Int!) {
+  organization(login: $login) {
+    projectV2(number: $number) {
+      id
+    }
+  }
+  user(login: $login) {
+    projectV2(number: $number) {
+      id
+    }
+  }
+}
+"""
+
+_F_PROJECT_FIELDS = """
+fragment ProjectFieldsFragment on ProjectV2 {
+  fields(first: 50) {
+    nodes {
+      ... on ProjectV2Field { id name dataType __typename }
+      ... on ProjectV2IterationField {
+         id name dataType __typename
+         configuration { iterations { id title startDate duration } }
+      }
+      ... on ProjectV2SingleSelectField {
+         id name dataType __typename
+         options { id name color description }
+      }
+      # Add other field types if needed
+    }
+  }
+}
+"""
+
+_F_PROJECT_ITEMS = """
+fragment FieldValuesFragment on ProjectV2ItemFieldValueConnection {
+    nodes {
+       ... on ProjectV2ItemFieldTextValue { __typename text field { ... on ProjectV2FieldCommon { name } } }
+       ... on ProjectV2ItemFieldDateValue { __typename date field { ... on ProjectV2FieldCommon { name } } }
+       ... on ProjectV2ItemFieldSingleSelectValue { __typename name field { ... on ProjectV2FieldCommon { name } } }
+       ... on ProjectV2ItemFieldNumberValue { __typename number field { ... on ProjectV2FieldCommon { name } } }
+       ... on ProjectV2ItemFieldIterationValue { __typename title startDate duration field { ... on ProjectV2FieldCommon { name } } }
+       ... on ProjectV2ItemFieldLabelValue { __typename field { ... on ProjectV2FieldCommon { name } } labels(first: 10) { nodes { id name color } } }
+    }
+}
+
+fragment ContentFragment on ProjectV2ItemContent {
+   ... on Issue { __typename id number title state url repository { name owner { login } } issueType { id name color } }
+   ... on PullRequest { __typename id number title state url repository { name owner { login } } }
+   ... on DraftIssue { __typename id title body }
+}
+
+fragment ProjectItemsFragment on ProjectV2 {
+  items(first: $first, after: $cursor) {
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+    edges {
+      cursor
+      node {
+        id
+        type
+        fieldValues(first: 20) { ...FieldValuesFragment }
+        content { ...ContentFragment }
+      }
+    }
+  }
+}
+"""
+
+_Q_GET_PROJECT_FIELDS = _F_PROJECT_FIELDS + """
+query GetProjectFields($projectId: ID!) {
+  node(id: $projectId) {
+    ...ProjectFieldsFragment
+  }
+}
+"""
+
+_Q_GET_PROJECT_ITEMS = _F_PROJECT_ITEMS + """
+query GetProjectItems($projectId: ID!, $first: Int!, $cursor: String) {
+  node(id: $projectId) {
+    ...ProjectItemsFragment
+  }
+}
+"""
+
+# Filtered reads need the field metadata too; fetch both in one round-trip
+_Q_GET_PROJECT_ITEMS_WITH_FIELDS = _F_PROJECT_FIELDS + _F_PROJECT_ITEMS + """
+query GetProjectItemsWithFields($projectId: ID!, $first: Int!, $cursor: String) {
+  node(id: $projectId) {
+    ...ProjectFieldsFragment
+    ...ProjectItemsFragment
+  }
+}
+"""
+
+_M_CREATE_ISSUE = """
+mutation CreateIssue($repositoryId: ID!, $title: String!, $body: String, $assigneeIds: [ID!]) {
+  createIssue(input: {
+    repositoryId: $repositoryId,
+    title: $title,
+    body: $body,
+    assigneeIds: $assigneeIds
+  }) {
+    issue {
+      id
+      number
+      title
+      url
+      state
+      assignees(first: 10) {
+        nodes {
+          login
+          id
+        }
+      }
+    }
+  }
+}
+"""
+
+_Q_GET_REPOSITORY_ID = """
+query GetRepositoryId($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+  }
+}
+"""
+
+_Q_GET_ISSUE_ID = """
+query GetIssueId($owner: String!, $repo: String!, $issueNumber: Int!) {
+  repository(owner: $owner, name: $repo) {
+    issue(number: $issueNumber) {
+      id
+    }
+  }
+}
+"""
+
+_M_ADD_ITEM_TO_PROJECT = """
+mutation AddItemToProject($projectId: ID!, $contentId: ID!) {
+  addProjectV2ItemById(input: {
+    projectId: $projectId,
+    contentId: $contentId
+  }) {
+    item {
+      id
+      content {
+        ... on Issue {
+          title
+          number
+        }
+        ... on PullRequest {
+          title
+          number
+        }
+      }
+    }
+  }
+}
+"""
+
+_M_ADD_DRAFT_ISSUE = """
+mutation AddDraftIssueToProject($projectId: ID!, $title: String!, $body: String) {
+  addProjectV2DraftIssue(input: {
+    projectId: $projectId,
+    title: $title,
+    body: $body
+  }) {
+    projectItem {
+      id
+    }
+  }
+}
+"""
+
+_M_UPDATE_FIELD_VALUE = """
+mutation UpdateProjectFieldValue($projectId: ID!, $itemId: ID!, $fieldId: ID!, $value: ProjectV2FieldValue!) {
+  updateProjectV2ItemFieldValue(input: {
+    projectId: $projectId,
+    itemId: $itemId,
+    fieldId: $fieldId,
+    value: $value
+  }) {
+    projectV2Item {
+      id
+    }
+  }
+}
+"""
+
+_M_DELETE_PROJECT_ITEM = """
+mutation DeleteProjectItem($projectId: ID!, $itemId: ID!) {
+  deleteProjectV2Item(input: {
+    projectId: $projectId,
+    itemId: $itemId
+  }) {
+    deletedItemId
+  }
+}
+"""
+
+_M_UPDATE_PROJECT = """
+mutation UpdateProject($input: UpdateProjectV2Input!) {
+  updateProjectV2(input: $input) {
+    projectV2 {
+      id
+      title
+      shortDescription
+      public
+      url
+    }
+  }
+}
+"""
+
+_Q_GET_REPOSITORY_LABELS = """
+query GetRepositoryLabels($owner: String!, $repo: String!) {
+  repository(owner: $owner, name: $repo) {
+    labels(first: 100) {
+      nodes {
+        id
+        name
+        color
+        description
+      }
+    }
+  }
+}
+"""
+
+_Q_GET_REPOSITORY_ISSUE_TYPES = """
+query GetRepositoryIssueTypes($owner: String!, $repo: String!) {
+  repository(owner: $owner, name: $repo) {
+    issueTypes(first: 100) {
+      nodes {
+        id
+        name
+        color
+        description
+        isEnabled
+      }
+    }
+  }
+}
+"""
+
+_M_UPDATE_ISSUE_LABELS = """
+mutation UpdateIssueLabels($issueId: ID!, $labelIds: [ID!]!) {
+  updateIssue(input: {
+    id: $issueId,
+    labelIds: $labelIds
+  }) {
+    issue {
+      id
+      number
+      title
+      labels(first: 20) {
+        nodes {
+          id
+          name
+          color
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _fields_details_from_nodes(
+    fields_nodes: List[Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """Map ProjectFieldsFragment nodes to the get_project_fields_details shape."""
+    field_details_map: Dict[str, Dict[str, Any]] = {}
+    for field in fields_nodes:
+        field_name = field.get("name")
+        if field_name:
+            options_map = {}
+            if field.get("options"):
+                options_map = {opt["name"]: opt["id"] for opt in field["options"]}
+            iterations_map = {}
+            iterations = field.get("configuration", {}).get("iterations")
+            if field.get("__typename") == "ProjectV2IterationField" and iterations:
+                iterations_map = {iter["title"]: iter["id"] for iter in iterations}
+
+            field_details_map[field_name] = {
+                "id": field.get("id"),
+                "type": field.get("__typename"),
+                "data_type": field.get("dataType"),  # e.g. TEXT, NUMBER, DATE
+                "options": options_map,  # Map Name -> ID
+                "iterations": iterations_map,
+            }
+    return field_details_map
+
+
 class GitHubClientError(Exception):
     """Custom exception for GitHubClient errors."""
 
@@ -29,11 +395,15 @@ class GitHubClientError(Exception):
 class GitHubClient:
     """Client for interacting with the GitHub GraphQL API."""
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self, token: Optional[str] = None, client: Optional[httpx.AsyncClient] = None
+    ):
         """Initialize the GitHub client.
 
         Args:
             token: GitHub personal access token. If None, it will use the GITHUB_TOKEN env var.
+            client: Shared HTTP client to send requests with. If None, a client with
+                a keep-alive connection pool is created and owned by this instance.
         """
         self.token = token or os.getenv("GITHUB_TOKEN")
         if not self.token:
@@ -45,6 +415,17 @@ class GitHubClient:
             "Content-Type": "application/json",
             "Accept": "application/vnd.github.v4+json",
         }
+        # Reuse connections across queries instead of a new TLS handshake per call
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=30.0,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client if this instance created it."""
+        if self._owns_client:
+            await self._client.aclose()
 
     def _find_case_insensitive_key(
         self, dictionary: Dict[str, Any], key: str
@@ -86,36 +467,35 @@ class GitHubClient:
         payload = {"query": query, "variables": query_variables}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url, headers=self.headers, json=payload, timeout=30.0
-                )
-                response.raise_for_status()  # Raise HTTP errors
-                result = response.json()
-
-                # Check for errors AND the presence of data
-                if "errors" in result:
-                    data = result.get("data")
-                    if data is None:
-                        # No data returned, errors are fatal
-                        error_message = f"GraphQL query failed with errors and returned no data: {result['errors']}"
-                        logger.error(error_message)
-                        raise GitHubClientError(error_message)
-                    else:
-                        # Data IS present, log errors as warnings but proceed
-                        logger.warning(
-                            f"GraphQL query returned errors but also data: {result['errors']}"
-                        )
+            response = await self._client.post(
+                self.api_url, headers=self.headers, content=_json_dumps(payload)
+            )
+            response.raise_for_status()  # Raise HTTP errors
+            result = _json_loads(response.content)
 
-                # If we reach here, either there were no errors, or there were errors but also data.
+            # Check for errors AND the presence of data
+            if "errors" in result:
                 data = result.get("data")
                 if data is None:
-                    # This case should now only happen if there were no errors but still no data.
-                    raise GitHubClientError(
-                        "GraphQL query returned no data and no errors."
+                    # No data returned, errors are fatal
+                    error_message = f"GraphQL query failed with errors and returned no data: {result['errors']}"
+                    logger.error(error_message)
+                    raise GitHubClientError(error_message)
+                else:
+                    # Data IS present, log errors as warnings but proceed
+                    logger.warning(
+                        f"GraphQL query returned errors but also data: {result['errors']}"
                     )
 
-                return data  # Return data
+            # If we reach here, either there were no errors, or there were errors but also data.
+            data = result.get("data")
+            if data is None:
+                # This case should now only happen if there were no errors but still no data.
+                raise GitHubClientError(
+                    "GraphQL query returned no data and no errors."
+                )
+
+            return data  # Return data
         except httpx.HTTPStatusError as e:
             error_message = f"HTTP error executing GraphQL query: {e.response.status_code} - {e.response.text}"
             logger.error(error_message)
@@ -138,25 +518,10 @@ class GitHubClient:
             GitHubClientError: If the owner is not found or projects cannot be retrieved.
         """
         # First determine if this is a user or organization
-        query = """
-        query GetOwnerType($login: String!) {
-          organization(login: $login) {
-            id
-            login
-            __typename
-          }
-          user(login: $login) {
-            id
-            login
-            __typename
-          }
-        }
-        """
-
         variables = {"login": owner}
 
         try:
-            result = await self.execute_query(query, variables)
+            result = await self.execute_query(_Q_GET_OWNER_TYPE, variables)
         except GitHubClientError as e:
             logger.error(f"Failed to determine owner type for {owner}: {e}")
             raise  # Re-raise the error
@@ -178,28 +543,10 @@ class GitHubClient:
 
         # Now get the projects based on owner type
         if owner_type == "organization":
-            query = """
-            query GetOrgProjects($login: String!, $first: Int!) {
-              organization(login: $login) {
-                projectsV2(first: $first) {
-                  nodes {
-                    id
-                    number
-                    title
-                    shortDescription
-                    url
-                    closed
-                    public
-                  }
-                }
-              }
-            }
-            """
-
             variables = {"login": owner, "first": 50}
 
             try:
-                result = await self.execute_query(query, variables)
+                result = await self.execute_query(_Q_GET_ORG_PROJECTS, variables)
                 if not result.get("organization") or not result["organization"].get(
                     "projectsV2"
                 ):
@@ -212,28 +559,10 @@ class GitHubClient:
                 raise
 
         elif owner_type == "user":
-            query = """
-            query GetUserProjects($login: String!, $first: Int!) {
-              user(login: $login) {
-                projectsV2(first: $first) {
-                  nodes {
-                    id
-                    number
-                    title
-                    shortDescription
-                    url
-                    closed
-                    public
-                  }
-                }
-              }
-            }
-            """
-
             variables = {"login": owner, "first": 50}
 
             try:
-                result = await self.execute_query(query, variables)
+                result = await self.execute_query(_Q_GET_USER_PROJECTS, variables)
                 if not result.get("user") or not result["user"].get("projectsV2"):
                     raise GitHubClientError(
                         f"Could not retrieve projects for user {owner}"
@@ -260,25 +589,10 @@ class GitHubClient:
             GitHubClientError: If the project is not found.
         """
         # First determine if this is a user or organization
-        query = """
-        query GetProjectId($login: String!, $number: Int!) {
-          organization(login: $login) {
-            projectV2(number: $number) {
-              id
-            }
-          }
-          user(login: $login) {
-            projectV2(number: $number) {
-              id
-            }
-          }
-        }
-        """
-
         variables = {"login": owner, "number": project_number}
 
         try:
-            result = await self.execute_query(query, variables)
+            result = await self.execute_query(_Q_GET_PROJECT_ID, variables)
         except GitHubClientError as e:
             logger.error(
                 f"Failed to query project ID for {owner}/{project_number}: {e}"
@@ -303,7 +617,7 @@ class GitHubClient:
             owner: The GitHub organization or user name
             project_number: The project number
         Returns:
-            Dictionary mapping field name to its details (id, type, options).
+            Dictionary mapping field name to its details (id, type, data_type, options).
         Raises:
 
             GitHubClientError: If project or fields cannot be retrieved.
@@ -314,69 +628,16 @@ class GitHubClient:
             logger.error(f"Cannot get fields details: {e}")
             raise
 
-        query = """
-        query GetProjectFields($projectId: ID!) {
-          node(id: $projectId) {
-            ... on ProjectV2 {
-              fields(first: 50) {
-                nodes {
-                  ... on ProjectV2Field { id name __typename }
-                  ... on ProjectV2IterationField {
-                     id name __typename
-                     configuration { iterations { id title startDate duration } }
-                  }
-                  ... on ProjectV2SingleSelectField {
-                     id name __typename
-                     options { id name color description }
-                  }
-                  # Add other field types if needed
-                }
-              }
-            }
-          }
-        }
-        """
         variables = {"projectId": project_id}
 
         try:
-            result = await self.execute_query(query, variables)
+            result = await self.execute_query(_Q_GET_PROJECT_FIELDS, variables)
             if not result.get("node") or not result["node"].get("fields"):
                 raise GitHubClientError(
                     f"Could not retrieve fields for project {owner}/{project_number}"
                 )
 
-            fields_nodes = result["node"]["fields"]["nodes"]
-            field_details_map: Dict[str, Dict[str, Any]] = {}
-            for field in fields_nodes:
-                field_name = field.get("name")
-                if field_name:
-                    options_map = {}
-                    if field.get("options"):
-                        options_map = {
-                            opt["name"]: opt["id"] for opt in field["options"]
-                        }
-                    iterations_map = {}
-                    if field.get(
-                        "__typename"
-                    ) == "ProjectV2IterationField" and field.get(
-                        "configuration", {}
-                    ).get(
-                        "iterations"
-                    ):
-                        iterations = field.get("configuration", {}).get(
-                            "iterations", []
-                        )
-                        iterations_map = {
-                            iter["title"]: iter["id"] for iter in iterations
-                        }
-
-                    field_details_map[field_name] = {
-                        "id": field.get("id"),
-                        "type": field.get("__typename"),
-                        "options": options_map,  # Map Name -> ID
-                        "iterations": iterations_map,
-                    }
-            return field_details_map
+            return _fields_details_from_nodes(result["node"]["fields"]["nodes"])
         except GitHubClientError as e:
             logger.error(
                 f"Failed to get fields details for project {owner}/{project_number}: {e}"
@@ -399,6 +660,8 @@ class GitHubClient:
         filter_field_name: Optional[str] = None,
         filter_field_value: Optional[str] = None,
         cursor: Optional[str] = None,
+        fields_details: Optional[Dict[str, Dict[str, Any]]] = None,
+        project_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Get items in a GitHub Project V2, optionally filtering by state or a custom field value.
@@ -410,19 +673,25 @@ class GitHubClient:
             filter_field_name: Optional name of a custom field to filter by (e.g., "Status").
             filter_field_value: Optional value of the custom field to filter by (e.g., "Backlog").
             cursor: Optional cursor for pagination (default: None for first page)
+            fields_details: Optional pre-fetched result of get_project_fields_details,
+                used to resolve the filter field without another API call.
+            project_id: Optional project node ID, to skip looking it up again.
         Returns:
             Dictionary containing:
                 - items: List of project items
                 - pageInfo: Information about pagination (hasNextPage, endCursor)
+                - fields: The project field details, only present when they were
+                  fetched along with the items (filtering without fields_details)
         Raises:
             GitHubClientError: If project or items cannot be retrieved, or filter is invalid.
             ValueError: If filter parameters are invalid.
         """
-        try:
-            project_id = await self.get_project_node_id(owner, project_number)
-        except GitHubClientError as e:
-            logger.error(f"Cannot get items: {e}")
-            raise
+        if project_id is None:
+            try:
+                project_id = await self.get_project_node_id(owner, project_number)
+            except GitHubClientError as e:
+                logger.error(f"Cannot get items: {e}")
+                raise
 
         # When filtering, we need to fetch more items since many will be excluded
         # Increase the fetch size to be more efficient
@@ -434,35 +703,12 @@ class GitHubClient:
                 f"Filtering enabled: increasing fetch limit from {limit} to {fetch_limit}"
             )
 
-        # Prepare variables dict before use
-        variables: Dict[str, Any] = {"projectId": project_id, "first": fetch_limit}
-
-        # Add cursor if provided (for pagination)
-        after_clause = ""
-        if cursor:
-            variables["cursor"] = cursor
-            after_clause = ", after: $cursor"
-
-        # Base query definition including fragments
-        field_values_fragment = """
-        fragment FieldValuesFragment on ProjectV2ItemFieldValueConnection {
-            nodes {
-               ... on ProjectV2ItemFieldTextValue { __typename text field { ... on ProjectV2FieldCommon { name } } }
-               ... on ProjectV2ItemFieldDateValue { __typename date field { ... on ProjectV2FieldCommon { name } } }
-               ... on ProjectV2ItemFieldSingleSelectValue { __typename name field { ... on ProjectV2FieldCommon { name } } }
-               ... on ProjectV2ItemFieldNumberValue { __typename number field { ... on ProjectV2FieldCommon { name } } }
-               ... on ProjectV2ItemFieldIterationValue { __typename title startDate duration field { ... on ProjectV2FieldCommon { name } } }
-               ... on ProjectV2ItemFieldLabelValue { __typename field { ... on ProjectV2FieldCommon { name } } labels(first: 10) { nodes { id name color } } }
-            }
-        }
-        """
-        content_fragment = """
-        fragment ContentFragment on ProjectV2ItemContent {
-           ... on Issue { __typename id number title state url repository { name owner { login } } issueType { id name color } }
-           ... on PullRequest { __typename id number title state url repository { name owner { login } } }
-           ... on DraftIssue { __typename id title body }
+        # Prepare variables dict before use (a null cursor starts at the first page)
+        variables: Dict[str, Any] = {
+            "projectId": project_id,
+            "first": fetch_limit,
+            "cursor": cursor,
         }
-        """
 
         # Build filter parameters if needed
         filter_conditions = []
@@ -477,11 +723,23 @@ class GitHubClient:
         field_id_var = None
         option_id_var = None
 
+        # Without pre-fetched fields, read them in the same query as the items
+        fused_result = None
+        if filter_field_name and filter_field_value and fields_details is None:
+            logger.debug(f"Executing fused fields+items query with vars: {variables}")
+            fused_result = await self.execute_query(
+                _Q_GET_PROJECT_ITEMS_WITH_FIELDS, variables
+            )
+            node = (fused_result or {}).get("node") or {}
+            if not node.get("fields"):
+                raise GitHubClientError(
+                    f"Could not retrieve fields for project {owner}/{project_number}"
+                )
+            fields_details = _fields_details_from_nodes(node["fields"]["nodes"])
+
         if filter_field_name and filter_field_value:
             try:
-                all_fields = await self.get_project_fields_details(
-                    owner, project_number
-                )
+                all_fields = fields_details
                 logger.debug(f"All fields available: {list(all_fields.keys())}")
 
                 # First try exact match
@@ -577,34 +835,12 @@ class GitHubClient:
                 logger.error(f"Invalid filter input: {e}")
                 raise
 
-        # Use single curly braces for GraphQL, not double curly braces for f-string
-        query = f"""
-        {field_values_fragment}
-        {content_fragment}
-        query GetProjectItems($projectId: ID!, $first: Int!{', $cursor: String' if cursor else ''}) {{
-          node(id: $projectId) {{
-            ... on ProjectV2 {{
-              items(first: $first{after_clause}) {{
-                pageInfo {{
-                  hasNextPage
-                  endCursor
-                }}
-                nodes {{
-                  id
-                  type
-                  fieldValues(first: 20) {{ ...FieldValuesFragment }}
-                  content {{ ...ContentFragment }}
-                }}
-              }}
-            }}
-          }}
-        }}
-        """
-
-        logger.debug(f"Executing items query: {query} with vars: {variables}")
-
         try:
-            result = await self.execute_query(query, variables)
+            if fused_result is not None:
+                result = fused_result
+            else:
+                logger.debug(f"Executing items query with vars: {variables}")
+                result = await self.execute_query(_Q_GET_PROJECT_ITEMS, variables)
             if result is None:
                 logger.warning(
                     f"Query returned None result for project {owner}/{project_number}"
@@ -631,7 +867,10 @@ class GitHubClient:
 
             # Get pagination info
             page_info = items_data.get("pageInfo", {})
-            items = items_data.get("nodes", [])
+            edges = items_data.get("edges") or []
+            items = [edge["node"] for edge in edges]
+            # Per-item cursors, to resume right after an item when a page is trimmed
+            item_cursors = {edge["node"].get("id"): edge.get("cursor") for edge in edges}
 
             logger.debug(
                 f"Retrieved {len(items)} items from project {owner}/{project_number}"
@@ -763,10 +1002,11 @@ class GitHubClient:
             # When filtering, we may have fetched more than requested, so trim to the requested limit
             if filter_field_name and filter_field_value and len(filtered_items) > limit:
                 filtered_items = filtered_items[:limit]
-                # Update pagination info to indicate there may be more filtered results
+                # Resume after the last item returned, not after the whole fetched
+                # page, so the matches that were trimmed off are not skipped
                 page_info = {
                     "hasNextPage": True,
-                    "endCursor": page_info.get("endCursor"),
+                    "endCursor": item_cursors.get(filtered_items[-1].get("id")),
                 }
 
             # Emergency check: if we're filtering and got very few results, warn that there might be more
@@ -784,13 +1024,80 @@ class GitHubClient:
             logger.debug(
                 f"Filtered down to {len(filtered_items)} items for project {owner}/{project_number} using criteria field_name={filter_field_name}, field_value={filter_field_value}"
             )
-            return {"items": filtered_items, "pageInfo": page_info}
+            page = {"items": filtered_items, "pageInfo": page_info}
+            if fused_result is not None:
+                page["fields"] = fields_details
+            return page
         except GitHubClientError as e:
             logger.error(
                 f"Failed to get items for project {owner}/{project_number}: {e}"
             )
             raise
 
+    async def iter_project_item_pages(
+        self,
+        owner: str,
+        project_number: int,
+        limit: int = 10,
+        state: Optional[str] = None,
+        filter_field_name: Optional[str] = None,
+        filter_field_value: Optional[str] = None,
+        cursor: Optional[str] = None,
+        fields_details: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lazily yield pages of project items, following pageInfo.endCursor until
+        `limit` items have been yielded or the project has no more items.
+        Args:
+            owner: The GitHub organization or user name
+            project_number: The project number
+            limit: Maximum number of items to yield across all pages (default: 10)
+            state: Optional state to filter items by (e.g., "OPEN", "CLOSED").
+            filter_field_name: Optional name of a custom field to filter by (e.g., "Status").
+            filter_field_value: Optional value of the custom field to filter by (e.g., "Backlog").
+            cursor: Optional cursor to start from (default: None for first page)
+            fields_details: Optional pre-fetched result of get_project_fields_details.
+            max_pages: Optional maximum number of pages to fetch (default: no limit)
+        Yields:
+            Dictionaries shaped like the get_project_items result. The pageInfo of
+            the last page yielded tells where to resume.
+        Raises:
+            GitHubClientError: If project or items cannot be retrieved, or filter is invalid.
+            ValueError: If filter parameters are invalid.
+        """
+        try:
+            project_id = await self.get_project_node_id(owner, project_number)
+        except GitHubClientError as e:
+            logger.error(f"Cannot get items: {e}")
+            raise
+
+        remaining = limit
+        pages_fetched = 0
+        while remaining > 0:
+            page = await self.get_project_items(
+                owner,
+                project_number,
+                remaining,
+                state,
+                filter_field_name,
+                filter_field_value,
+                cursor,
+                fields_details,
+                project_id,
+            )
+            pages_fetched += 1
+            remaining -= len(page["items"])
+            fields_details = page.get("fields", fields_details)
+            yield page
+
+            page_info = page["pageInfo"]
+            cursor = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not cursor:
+                return
+            if max_pages is not None and pages_fetched >= max_pages:
+                return
+
     async def _get_user_ids(self, usernames: List[str]) -> List[str]:
         """Get GitHub user IDs from usernames.
 
@@ -853,61 +1160,35 @@ class GitHubClient:
         Raises:
             GitHubClientError: If repository is not found or issue creation fails.
         """
-        query = """
-        mutation CreateIssue($repositoryId: ID!, $title: String!, $body: String, $assigneeIds: [ID!]) {
-          createIssue(input: {
-            repositoryId: $repositoryId,
-            title: $title,
-            body: $body,
-            assigneeIds: $assigneeIds
-          }) {
-            issue {
-              id
-              number
-              title
-              url
-              state
-              assignees(first: 10) {
-                nodes {
-                  login
-                  id
-                }
-              }
-            }
-          }
-        }
-        """
-
         # First get the repository ID
-        repo_query = """
-        query GetRepositoryId($owner: String!, $name: String!) {
-          repository(owner: $owner, name: $name) {
-            id
-          }
-        }
-        """
-
         repo_variables = {"owner": owner, "name": repo}
 
-        try:
-            repo_result = await self.execute_query(repo_query, repo_variables)
-            if not repo_result.get("repository"):
-                raise GitHubClientError(f"Repository {owner}/{repo} not found")
-        except GitHubClientError as e:
-            logger.error(f"Failed to get repository ID for {owner}/{repo}: {e}")
-            raise
-
-        repository_id = repo_result["repository"]["id"]
+        async def get_repository_id() -> str:
+            try:
+                repo_result = await self.execute_query(
+                    _Q_GET_REPOSITORY_ID, repo_variables
+                )
+                if not repo_result.get("repository"):
+                    raise GitHubClientError(f"Repository {owner}/{repo} not found")
+            except GitHubClientError as e:
+                logger.error(f"Failed to get repository ID for {owner}/{repo}: {e}")
+                raise
+            return repo_result["repository"]["id"]
 
-        # Get assignee IDs if assignees are provided
-        assignee_ids = None
-        if assignees:
+        async def get_assignee_ids() -> Optional[List[str]]:
+            if not assignees:
+                return None
             try:
-                assignee_ids = await self._get_user_ids(assignees)
+                return await self._get_user_ids(assignees)
             except GitHubClientError as e:
                 logger.error(f"Failed to get assignee IDs: {e}")
                 raise
 
+        # The repository and assignee lookups are independent, run them concurrently
+        repository_id, assignee_ids = await asyncio.gather(
+            get_repository_id(), get_assignee_ids()
+        )
+
         variables = {
             "repositoryId": repository_id, 
             "title": title, 
@@ -916,7 +1197,7 @@ class GitHubClient:
         }
 
         try:
-            result = await self.execute_query(query, variables)
+            result = await self.execute_query(_M_CREATE_ISSUE, variables)
             if not result.get("createIssue") or not result["createIssue"].get("issue"):
                 raise GitHubClientError(f"Failed to create issue in {owner}/{repo}")
             return result["createIssue"]["issue"]
@@ -947,74 +1228,46 @@ class GitHubClient:
         Raises:
             GitHubClientError: If project or issue is not found, or adding fails.
         """
-        # Get project ID
-        try:
-            project_id = await self.get_project_node_id(owner, project_number)
-        except GitHubClientError as e:
-            logger.error(f"Cannot add issue: {e}")
-            raise
+        async def get_project_id() -> str:
+            try:
+                return await self.get_project_node_id(owner, project_number)
+            except GitHubClientError as e:
+                logger.error(f"Cannot add issue: {e}")
+                raise
 
         # Get issue ID
-        issue_query = """
-        query GetIssueId($owner: String!, $repo: String!, $number: Int!) {
-          repository(owner: $owner, name: $repo) {
-            issue(number: $number) {
-              id
-            }
-          }
-        }
-        """
-
         issue_variables = {
             "owner": issue_owner,
             "repo": issue_repo,
-            "number": issue_number,
+            "issueNumber": issue_number,
         }
 
-        try:
-            issue_result = await self.execute_query(issue_query, issue_variables)
-            if not issue_result.get("repository") or not issue_result["repository"].get(
-                "issue"
-            ):
-                raise GitHubClientError(
-                    f"Issue {issue_number} not found in {issue_owner}/{issue_repo}"
+        async def get_issue_id() -> str:
+            try:
+                issue_result = await self.execute_query(
+                    _Q_GET_ISSUE_ID, issue_variables
                 )
-        except GitHubClientError as e:
-            logger.error(
-                f"Failed to get issue ID for {issue_owner}/{issue_repo}#{issue_number}: {e}"
-            )
-            raise
+                if not issue_result.get("repository") or not issue_result[
+                    "repository"
+                ].get("issue"):
+                    raise GitHubClientError(
+                        f"Issue {issue_number} not found in {issue_owner}/{issue_repo}"
+                    )
+            except GitHubClientError as e:
+                logger.error(
+                    f"Failed to get issue ID for {issue_owner}/{issue_repo}#{issue_number}: {e}"
+                )
+                raise
+            return issue_result["repository"]["issue"]["id"]
 
-        issue_id = issue_result["repository"]["issue"]["id"]
+        # The project and issue lookups are independent, run them concurrently
+        project_id, issue_id = await asyncio.gather(get_project_id(), get_issue_id())
 
         # Add issue to project
-        add_query = """
-        mutation AddItemToProject($projectId: ID!, $contentId: ID!) {
-          addProjectV2ItemById(input: {
-            projectId: $projectId,
-            contentId: $contentId
-          }) {
-            item {
-              id
-              content {
-                ... on Issue {
-                  title
-                  number
-                }
-                ... on PullRequest {
-                  title
-                  number
-                }
-              }
-            }
-          }
-        }
-        """
-
         variables = {"projectId": project_id, "contentId": issue_id}
 
         try:
-            result = await self.execute_query(add_query, variables)
+            result = await self.execute_query(_M_ADD_ITEM_TO_PROJECT, variables)
             if not result.get("addProjectV2ItemById") or not result[
                 "addProjectV2ItemById"
             ].get("item"):
@@ -1055,20 +1308,6 @@ class GitHubClient:
             raise
 
         # Add draft issue to project
-        add_query = """
-        mutation AddDraftIssueToProject($projectId: ID!, $title: String!, $body: String) {
-          addProjectV2DraftIssue(input: {
-            projectId: $projectId,
-            title: $title,
-            body: $body
-          }) {
-            projectItem {
-              id
-            }
-          }
-        }
-        """
-
         # Note: GitHub API doesn't support assignees directly in draft issue creation
         # Assignees would need to be set through field updates after creation
         if assignees:
@@ -1081,7 +1320,7 @@ class GitHubClient:
         variables = {"projectId": project_id, "title": title, "body": body}
 
         try:
-            result = await self.execute_query(add_query, variables)
+            result = await self.execute_query(_M_ADD_DRAFT_ISSUE, variables)
             if not result.get("addProjectV2DraftIssue") or not result[
                 "addProjectV2DraftIssue"
             ].get("projectItem"):
@@ -1093,51 +1332,43 @@ class GitHubClient:
             logger.error(f"Failed to add draft issue to project {project_number}: {e}")
             raise
 
-    async def update_project_item_field(
-        self,
-        owner: str,
-        project_number: int,
-        item_id: str,
-        field_id: str,
-        value: Any,  # Value type depends on the field
+    def _field_value_input(
+        self, field_id: str, value: Any, data_type: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Update a field value for an item in a GitHub Project V2.
+        """Build the ProjectV2FieldValue input for a field update.
 
         Args:
-            owner: The GitHub organization or user name that owns the project
-            project_number: The project number
-            item_id: The project item ID
             field_id: The field ID to update
-            value: The new value (type depends on field: string, number, date, boolean, iteration ID, single select option ID)
+            value: The new value
+            data_type: The field's dataType, if known. Otherwise the field type is
+                guessed from the field ID prefix.
 
         Returns:
-            The updated project item data (containing the item ID)
+            The ProjectV2FieldValue input dictionary
 
         Raises:
-            GitHubClientError: If project not found or update fails.
+            GitHubClientError: If the value does not fit the field type or the field is read-only.
         """
-        # Get project ID
-        try:
-            project_id = await self.get_project_node_id(owner, project_number)
-        except GitHubClientError as e:
-            logger.error(f"Cannot update item field: {e}")
-            raise
-
-        # Prepare value based on its type and field ID convention
-        # This mapping might need refinement based on actual field types fetched separately
-        field_value_input: Dict[str, Any] = {}
-
-        # Heuristic based on ID prefix - A better approach would be to fetch field type first
-        if field_id.startswith("PVTSSF_"):  # Single Select Field (assumed prefix)
+        if data_type == "NUMBER":
+            if isinstance(value, (int, float)):
+                return {"number": float(value)}
+            else:
+                raise GitHubClientError(
+                    f"Invalid value type for number field {field_id}. Expected int or float."
+                )
+        elif data_type in _DATA_TYPE_VALUE_KEYS:
+            return {_DATA_TYPE_VALUE_KEYS[data_type]: str(value)}
+        # Heuristic based on ID prefix when the field type is not known
+        elif field_id.startswith("PVTSSF_"):  # Single Select Field (assumed prefix)
             if isinstance(value, str):
-                field_value_input = {"singleSelectOptionId": value}
+                return {"singleSelectOptionId": value}
             else:
                 raise GitHubClientError(
                     f"Invalid value type for single select field {field_id}. Expected option ID string."
                 )
         elif field_id.startswith("PVTIF_"):  # Iteration Field (assumed prefix)
             if isinstance(value, str):
-                field_value_input = {"iterationId": value}
+                return {"iterationId": value}
             else:
                 raise GitHubClientError(
                     f"Invalid value type for iteration field {field_id}. Expected iteration ID string."
@@ -1156,21 +1387,19 @@ class GitHubClient:
         # Add more field types based on prefixes or fetched field info
         elif field_id.startswith("PVTF_"):  # Text Field (assumed prefix)
             if isinstance(value, str):
-                field_value_input = {"text": value}
+                return {"text": value}
             else:  # Attempt to convert
-                field_value_input = {"text": str(value)}
+                return {"text": str(value)}
         elif field_id.startswith("PVTDF_"):  # Date Field (assumed prefix)
             if isinstance(value, str):  # Assuming date string like YYYY-MM-DD
-                field_value_input = {"date": value}
+                return {"date": value}
             else:
                 raise GitHubClientError(
                     f"Invalid value type for date field {field_id}. Expected date string (YYYY-MM-DD)."
                 )
         elif field_id.startswith("PVTNU_"):  # Number Field (assumed prefix)
             if isinstance(value, (int, float)):
-                field_value_input = {
-                    "number": float(value)
-                }  # GraphQL uses Float for numbers
+                return {"number": float(value)}  # GraphQL uses Float for numbers
             else:
                 raise GitHubClientError(
                     f"Invalid value type for number field {field_id}. Expected int or float."
@@ -1179,24 +1408,44 @@ class GitHubClient:
             logger.warning(
                 f"Unknown field type for {field_id}. Attempting to set as text."
             )
-            field_value_input = {"text": str(value)}
+            return {"text": str(value)}
 
-        # Update field value
-        update_query = """
-        mutation UpdateProjectFieldValue($projectId: ID!, $itemId: ID!, $fieldId: ID!, $value: ProjectV2FieldValue!) {
-          updateProjectV2ItemFieldValue(input: {
-            projectId: $projectId,
-            itemId: $itemId,
-            fieldId: $fieldId,
-            value: $value
-          }) {
-            projectV2Item {
-              id
-            }
-          }
-        }
+    async def update_project_item_field(
+        self,
+        owner: str,
+        project_number: int,
+        item_id: str,
+        field_id: str,
+        value: Any,  # Value type depends on the field
+        data_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Update a field value for an item in a GitHub Project V2.
+
+        Args:
+            owner: The GitHub organization or user name that owns the project
+            project_number: The project number
+            item_id: The project item ID
+            field_id: The field ID to update
+            value: The new value (type depends on field: string, number, date, boolean, iteration ID, single select option ID)
+            data_type: The field's dataType from get_project_fields_details (e.g. "NUMBER").
+                If None, the field type is guessed from the field ID prefix.
+
+        Returns:
+            The updated project item data (containing the item ID)
+
+        Raises:
+            GitHubClientError: If project not found or update fails.
         """
+        # Get project ID
+        try:
+            project_id = await self.get_project_node_id(owner, project_number)
+        except GitHubClientError as e:
+            logger.error(f"Cannot update item field: {e}")
+            raise
 
+        field_value_input = self._field_value_input(field_id, value, data_type)
+
+        # Update field value
         variables = {
             "projectId": project_id,
             "itemId": item_id,
@@ -1205,7 +1454,7 @@ class GitHubClient:
         }
 
         try:
-            result = await self.execute_query(update_query, variables)
+            result = await self.execute_query(_M_UPDATE_FIELD_VALUE, variables)
             if not result.get("updateProjectV2ItemFieldValue") or not result[
                 "updateProjectV2ItemFieldValue"
             ].get("projectV2Item"):
@@ -1217,6 +1466,83 @@ class GitHubClient:
             logger.error(f"Failed to update field {field_id} for item {item_id}: {e}")
             raise
 
+    async def update_project_item_fields(
+        self,
+        owner: str,
+        project_number: int,
+        item_id: str,
+        values: Dict[str, Any],
+        data_types: Optional[Dict[str, Optional[str]]] = None,
+    ) -> Dict[str, Any]:
+        """Update several field values of an item in a GitHub Project V2 in one request.
+
+        The updates are sent as aliased updateProjectV2ItemFieldValue mutations in a
+        single GraphQL document, so they cost one round-trip instead of one each.
+
+        Args:
+            owner: The GitHub organization or user name that owns the project
+            project_number: The project number
+            item_id: The project item ID
+            values: Mapping of field ID to the new value for that field
+            data_types: Optional mapping of field ID to the field's dataType
+                (see update_project_item_field)
+
+        Returns:
+            The updated project item data (containing the item ID)
+
+        Raises:
+            GitHubClientError: If project not found, no values are given or any update fails.
+        """
+        if not values:
+            raise GitHubClientError(f"No field values given to update for item {item_id}")
+
+        # Get project ID
+        try:
+            project_id = await self.get_project_node_id(owner, project_number)
+        except GitHubClientError as e:
+            logger.error(f"Cannot update item fields: {e}")
+            raise
+
+        data_types = data_types or {}
+        field_ids = list(values)
+        variable_defs = ["$projectId: ID!", "$itemId: ID!"]
+        updates = []
+        variables: Dict[str, Any] = {"projectId": project_id, "itemId": item_id}
+
+        for i, field_id in enumerate(field_ids):
+            variable_defs.append(f"$fieldId{i}: ID!, $value{i}: ProjectV2FieldValue!")
+            updates.append(
+                f"update{i}: updateProjectV2ItemFieldValue(input: {{"
+                f" projectId: $projectId, itemId: $itemId, fieldId: $fieldId{i}, value: $value{i}"
+                f" }}) {{ projectV2Item {{ id }} }}"
+            )
+            variables[f"fieldId{i}"] = field_id
+            variables[f"value{i}"] = self._field_value_input(
+                field_id, values[field_id], data_types.get(field_id)
+            )
+
+        update_query = f"""
+        mutation UpdateProjectFieldValues({', '.join(variable_defs)}) {{
+          {' '.join(updates)}
+        }}
+        """
+
+        try:
+            result = await self.execute_query(update_query, variables)
+            failed = [
+                field_id
+                for i, field_id in enumerate(field_ids)
+                if not (result.get(f"update{i}") or {}).get("projectV2Item")
+            ]
+            if failed:
+                raise GitHubClientError(
+                    f"Failed to update fields {failed} for item {item_id}"
+                )
+            return result["update0"]["projectV2Item"]
+        except GitHubClientError as e:
+            logger.error(f"Failed to update fields {field_ids} for item {item_id}: {e}")
+            raise
+
     async def delete_project_item(
         self, owner: str, project_number: int, item_id: str
     ) -> str:
@@ -1241,21 +1567,10 @@ class GitHubClient:
             raise
 
         # Delete item
-        delete_query = """
-        mutation DeleteProjectItem($projectId: ID!, $itemId: ID!) {
-          deleteProjectV2Item(input: {
-            projectId: $projectId,
-            itemId: $itemId
-          }) {
-            deletedItemId
-          }
-        }
-        """
-
         variables = {"projectId": project_id, "itemId": item_id}
 
         try:
-            result = await self.execute_query(delete_query, variables)
+            result = await self.execute_query(_M_DELETE_PROJECT_ITEM, variables)
             if not result.get("deleteProjectV2Item") or not result[
                 "deleteProjectV2Item"
             ].get("deletedItemId"):
@@ -1308,24 +1623,10 @@ class GitHubClient:
             input_params["public"] = public  # Keep as boolean
 
         # Update project
-        update_query = """
-        mutation UpdateProject($input: UpdateProjectV2Input!) {
-          updateProjectV2(input: $input) {
-            projectV2 {
-              id
-              title
-              shortDescription
-              public
-              url
-            }
-          }
-        }
-        """
-
         variables = {"input": input_params}
 
         try:
-            result = await self.execute_query(update_query, variables)
+            result = await self.execute_query(_M_UPDATE_PROJECT, variables)
             if not result.get("updateProjectV2") or not result["updateProjectV2"].get(
                 "projectV2"
             ):
@@ -1335,89 +1636,6 @@ class GitHubClient:
             logger.error(f"Failed to update project {project_number}: {e}")
             raise
 
-    async def get_repository_labels(self, owner: str, repo: str) -> List[Dict[str, Any]]:
-        """Get labels for a repository.
-
-        Args:
-            owner: The repository owner
-            repo: The repository name
-
-        Returns:
-            List of label dictionaries with id, name, color, description
-
-        Raises:
-            GitHubClientError: If repository not found or labels cannot be retrieved.
-        """
-        query = """
-        query GetRepositoryLabels($owner: String!, $repo: String!) {
-          repository(owner: $owner, name: $repo) {
-            labels(first: 100) {
-              nodes {
-                id
-                name
-                color
-                description
-              }
-            }
-          }
-        }
-        """
-
-        variables = {"owner": owner, "repo": repo}
-
-        try:
-            result = await self.execute_query(query, variables)
-            if not result.get("repository"):
-                raise GitHubClientError(f"Repository {owner}/{repo} not found")
-            
-            labels_data = result["repository"].get("labels", {}).get("nodes", [])
-            return labels_data
-        except GitHubClientError as e:
-            logger.error(f"Failed to get labels for {owner}/{repo}: {e}")
-            raise
-
-    async def get_repository_issue_types(self, owner: str, repo: str) -> List[Dict[str, Any]]:
-        """Get issue types for a repository.
-
-        Args:
-            owner: The repository owner
-            repo: The repository name
-
-        Returns:
-            List of issue type dictionaries with id, name, color, description, isEnabled
-
-        Raises:
-            GitHubClientError: If repository not found or issue types cannot be retrieved.
-        """
-        query = """
-        query GetRepositoryIssueTypes($owner: String!, $repo: String!) {
-          repository(owner: $owner, name: $repo) {
-            issueTypes(first: 50) {
-              nodes {
-                id
-                name
-                color
-                description
-                isEnabled
-              }
-            }
-          }
-        }
-        """
-
-        variables = {"owner": owner, "repo": repo}
-
-        try:
-            result = await self.execute_query(query, variables)
-            if not result.get("repository"):
-                raise GitHubClientError(f"Repository {owner}/{repo} not found")
-            
-            issue_types_data = result["repository"].get("issueTypes", {}).get("nodes", [])
-            return issue_types_data
-        except GitHubClientError as e:
-            logger.error(f"Failed to get issue types for {owner}/{repo}: {e}")
-            raise
-
     async def get_repository_labels(
         self, owner: str, repo: str
     ) -> List[Dict[str, Any]]:
@@ -1433,25 +1651,10 @@ class GitHubClient:
         Raises:
             GitHubClientError: If repository or labels cannot be retrieved.
         """
-        query = """
-        query GetRepositoryLabels($owner: String!, $repo: String!) {
-          repository(owner: $owner, name: $repo) {
-            labels(first: 100) {
-              nodes {
-                id
-                name
-                color
-                description
-              }
-            }
-          }
-        }
-        """
-
         variables = {"owner": owner, "repo": repo}
 
         try:
-            result = await self.execute_query(query, variables)
+            result = await self.execute_query(_Q_GET_REPOSITORY_LABELS, variables)
             if not result.get("repository") or not result["repository"].get("labels"):
                 raise GitHubClientError(
                     f"Could not retrieve labels for repository {owner}/{repo}"
@@ -1477,26 +1680,10 @@ class GitHubClient:
         Raises:
             GitHubClientError: If repository or issue types cannot be retrieved.
         """
-        query = """
-        query GetRepositoryIssueTypes($owner: String!, $repo: String!) {
-          repository(owner: $owner, name: $repo) {
-            issueTypes(first: 100) {
-              nodes {
-                id
-                name
-                color
-                description
-                isEnabled
-              }
-            }
-          }
-        }
-        """
-
         variables = {"owner": owner, "repo": repo}
 
         try:
-            result = await self.execute_query(query, variables)
+            result = await self.execute_query(_Q_GET_REPOSITORY_ISSUE_TYPES, variables)
             if not result.get("repository") or not result["repository"].get("issueTypes"):
                 # Issue types might not be available in all repositories
                 logger.info(f"No issue types found for repository {owner}/{repo}")
@@ -1524,28 +1711,6 @@ class GitHubClient:
         Raises:
             GitHubClientError: If update fails.
         """
-        mutation = """
-        mutation UpdateIssueLabels($issueId: ID!, $labelIds: [ID!]!) {
-          updateIssue(input: {
-            id: $issueId,
-            labelIds: $labelIds
-          }) {
-            issue {
-              id
-              number
-              title
-              labels(first: 20) {
-                nodes {
-                  id
-                  name
-                  color
-                }
-              }
-            }
-          }
-        }
-        """
-
         # First get the issue ID
         try:
             issue_id = await self.get_issue_node_id(owner, repo, issue_number)
@@ -1554,7 +1719,7 @@ class GitHubClient:
                 "labelIds": label_ids
             }
 
-            result = await self.execute_query(mutation, variables)
+            result = await self.execute_query(_M_UPDATE_ISSUE_LABELS, variables)
             if not result.get("updateIssue") or not result["updateIssue"].get("issue"):
                 raise GitHubClientError(f"Failed to update labels for issue #{issue_number}")
             
@@ -1577,16 +1742,6 @@ class GitHubClient:
         Raises:
             GitHubClientError: If issue not found.
         """
-        query = """
-        query GetIssueId($owner: String!, $repo: String!, $issueNumber: Int!) {
-          repository(owner: $owner, name: $repo) {
-            issue(number: $issueNumber) {
-              id
-            }
-          }
-        }
-        """
-
         variables = {
             "owner": owner,
             "repo": repo,
@@ -1594,7 +1749,7 @@ class GitHubClient:
         }
 
         try:
-            result = await self.execute_query(query, variables)
+            result = await self.execute_query(_Q_GET_ISSUE_ID, variables)
             if not result.get("repository") or not result["repository"].get("issue"):
                 raise GitHubClientError(f"Issue #{issue_number} not found in {owner}/{repo}")
             
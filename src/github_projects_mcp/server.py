@@ -6,25 +6,84 @@ A Model Context Protocol server that provides tools for managing GitHub Projects
 """
 
 
+import asyncio
+import atexit
+import base64
 import json
 import logging
+import logging.handlers
+import math
 import os
-from typing import Any, List, Optional
+import queue
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
-from dotenv import load_dotenv
+import httpx
 from fastmcp import FastMCP
 
 from .github_client import GitHubClient, GitHubClientError
 
-# Load environment variables from .env file if present
-load_dotenv()
+try:  # orjson is an optional, faster drop-in for serializing item content
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def _json_dumps(obj: Any) -> str:
+        # Match orjson's compact output so item text does not depend on extras
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _load_env() -> None:
+    """Load environment variables from ./.env, if there is one.
+
+    python-dotenv is only imported when the file exists, so deployments that
+    inject the environment directly skip the import and the parent-directory
+    search load_dotenv() would otherwise do.
+    """
+    if os.path.exists(".env"):
+        from dotenv import load_dotenv
+
+        load_dotenv(".env")
+
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_load_env()
+
+# Configure logging. Records go through a queue to a background thread, so the
+# stream writes never block the event loop serving the stdio transport.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+logging.root.addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.root.setLevel(logging.DEBUG)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush pending records on exit
 logger = logging.getLogger(__name__)
 
+# Process-wide HTTP client so every tool call reuses pooled keep-alive connections
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    timeout=30.0,
+)
+
+
 # Initialize the MCP server
 mcp = FastMCP(
     name="GitHub Projects V2",
@@ -34,8 +93,312 @@ mcp = FastMCP(
 # GitHub client for GraphQL API interactions
 github_client = GitHubClient(
     token=os.environ.get("GITHUB_TOKEN"),
+    client=http_client,
+)
+
+
+class _AsyncTTLCache:
+    """Small in-process TTL cache for the results of async loaders.
+
+    Concurrent misses for the same key are serialized on a per-key lock so only
+    one of them hits the GitHub API.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value for key, evicting the least recently used entries."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the cached value for key, if any."""
+        self._entries.pop(key, None)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for key, awaiting loader() on a miss."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                value = self.get(key)
+                if value is None:
+                    value = await loader()
+                    self.put(key, value)
+        finally:
+            # Drop the lock once the load settles, whether it succeeded or not,
+            # so failed or expired keys do not keep one around forever
+            if self._locks.get(key) is lock:
+                del self._locks[key]
+        return value
+
+
+class _ProjectFields(NamedTuple):
+    """Field details of a project, indexed by field name and by field ID."""
+
+    by_name: Dict[str, Dict[str, Any]]
+    by_id: Dict[str, Dict[str, Any]]
+    by_lower_name: Dict[str, Dict[str, Any]]
+
+    def resolve(self, name: str) -> Optional[Dict[str, Any]]:
+        """Find a field by name, exactly first and then case-insensitively."""
+        return self.by_name.get(name) or self.by_lower_name.get(name.lower())
+
+
+def _index_fields(fields_details: Dict[str, Dict[str, Any]]) -> _ProjectFields:
+    """Build the lookup indexes for a get_project_fields_details result."""
+    return _ProjectFields(
+        by_name=fields_details,
+        by_id={details["id"]: details for details in fields_details.values()},
+        by_lower_name={name.lower(): details for name, details in fields_details.items()},
+    )
+
+
+# Project field metadata rarely changes, so keep it for a minute to spare
+# repeated tool calls in a conversation the extra GraphQL round-trip.
+_fields_cache = _AsyncTTLCache(maxsize=256, ttl=60)
+
+
+async def _load_fields(owner: str, project_number: int) -> _ProjectFields:
+    """Fetch and index the field details of a project."""
+    return _index_fields(
+        await github_client.get_project_fields_details(owner, project_number)
+    )
+
+
+async def _cached_fields(owner: str, project_number: int) -> _ProjectFields:
+    """Get indexed project field details, served from the TTL cache when possible."""
+    return await _fields_cache.get_or_load(
+        (owner, project_number), lambda: _load_fields(owner, project_number)
+    )
+
+
+# The project list of an owner changes on the scale of minutes, while a session
+# tends to re-list it whenever it needs to rediscover a project number.
+_projects_cache = _AsyncTTLCache(maxsize=128, ttl=90)
+_projects_cache_hits = 0
+
+
+async def _fetch_projects(owner: str) -> List[Dict[str, Any]]:
+    """Get the projects of an owner, served from the TTL cache when possible."""
+    global _projects_cache_hits
+    projects = _projects_cache.get(owner)
+    if projects is not None:
+        _projects_cache_hits += 1
+        logger.debug(
+            f"list_projects cache hit for {owner} (total hits: {_projects_cache_hits})"
+        )
+        return projects
+    return await _projects_cache.get_or_load(
+        owner, lambda: github_client.get_projects(owner)
+    )
+
+
+def _parse_number(field_info: Dict[str, Any], raw: str) -> Any:
+    try:
+        return int(raw)
+    except ValueError:
+        value = float(raw)
+    # float() also parses "nan" and "inf", which GitHub cannot store
+    if not math.isfinite(value):
+        raise ValueError(f"Number must be finite, got {raw!r}")
+    return value
+
+
+def _parse_date(field_info: Dict[str, Any], raw: str) -> str:
+    return date.fromisoformat(raw).isoformat()
+
+
+def _parse_option(field_info: Dict[str, Any], raw: str) -> str:
+    # Accept an option name as well as an option ID
+    return field_info.get("options", {}).get(raw, raw)
+
+
+def _parse_iteration(field_info: Dict[str, Any], raw: str) -> str:
+    # Accept an iteration title as well as an iteration ID
+    return field_info.get("iterations", {}).get(raw, raw)
+
+
+# Converters from the tool's string input to the value each field dataType
+# expects. Text and any other type are sent as the raw string.
+_FIELD_VALUE_PARSERS: Dict[str, Callable[[Dict[str, Any], str], Any]] = {
+    "NUMBER": _parse_number,
+    "DATE": _parse_date,
+    "SINGLE_SELECT": _parse_option,
+    "ITERATION": _parse_iteration,
+}
+
+
+# Per-content-type renderers for get_project_items, built once at import time
+_ITEM_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "Issue": (
+        "  Type: Issue #{number} ({repo})\n"
+        "  Title: {title}\n"
+        "  State: {state}\n"
+        "  URL: {url}\n"
+    ).format_map,
+    "PullRequest": (
+        "  Type: PR #{number} ({repo})\n"
+        "  Title: {title}\n"
+        "  State: {state}\n"
+        "  URL: {url}\n"
+    ).format_map,
+    "DraftIssue": (
+        "  Type: Draft Issue ID: {id}\n"
+        "  Title: {title}\n"
+        "{body}"
+    ).format_map,
+}
+
+
+# Version tag of the page tokens handed out by get_project_items
+_CURSOR_VERSION = 1
+
+
+def _encode_cursor(end_cursor: str) -> str:
+    """Wrap a GraphQL endCursor in an opaque, versioned page token."""
+    envelope = json.dumps({"c": end_cursor, "v": _CURSOR_VERSION}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(envelope.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> str:
+    """Unwrap a page token from _encode_cursor, passing raw GraphQL cursors through."""
+    try:
+        envelope = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:  # Not base64-encoded JSON, so a raw cursor
+        return cursor
+    if isinstance(envelope, dict) and "c" in envelope:
+        return envelope["c"]
+    return cursor
+
+
+# Upper bound on pages scanned per call when filters leave pages without matches
+_MAX_ITEM_PAGES = 10
+
+# Identical get_project_items calls that overlap share one fetch. The result is
+# a str, so callers that join an in-flight task cannot mutate each other's copy.
+_inflight: Dict[Hashable, "asyncio.Future[str]"] = {}
+
+# Messages for the empty-result path of get_project_items
+_NO_ITEMS_TMPL = (
+    "No items found in project #{pn} for {o}{fd}\n\n"
+    "Note: If the project has many items, try increasing the limit parameter "
+    "to search more thoroughly."
+)
+_NO_ITEMS_DEBUG_TMPL = (
+    "No items found in project #{pn} for {o}{fd}\n\n"
+    "Debug info:\n"
+    "- Found field '{fn}' with type '{ft}'\n"
+    "- Available {kind}: {values}\n"
+    "- Note: Scanned up to {pages} pages looking for {lim} matching items. "
+    "If the project has many items, some '{fv}' items might be beyond this scope.\n"
+    "- Tip: Try increasing the limit parameter or check if the field value "
+    "spelling is correct."
 )
 
+
+def _format_item(item: Dict[str, Any]) -> str:
+    """Render one project item for the get_project_items tool output."""
+    content = item.get("content", {})
+    parts = [f"- Item ID: {item['id']}\n"]
+    item_type = content.get("__typename")
+    formatter = _ITEM_FORMATTERS.get(item_type)
+
+    if formatter is not None:
+        repo_info = content.get("repository", {})
+        # Draft issues carry a body instead of a repository
+        body = content.get("body", "")
+        parts.append(
+            formatter(
+                {
+                    "id": content.get("id"),
+                    "number": content.get("number"),
+                    "title": content.get("title"),
+                    "state": content.get("state"),
+                    "url": content.get("url"),
+                    "repo": (
+                        f"{repo_info.get('owner', {}).get('login')}/{repo_info.get('name')}"
+                        if repo_info
+                        else "N/A"
+                    ),
+                    "body": f"  Body: {body[:100]}...\n" if body else "",
+                }
+            )
+        )
+    else:
+        parts.append(
+            f"  Type: {item_type or 'Unknown'}\n"
+            f"  Content: {_json_dumps(content)}\n"
+        )
+
+    # Show processed field values
+    if item.get("fieldValues"):
+        parts.append("  Field Values:\n")
+        for field_name, value in item["fieldValues"].items():
+            parts.append(f"    - {field_name}: {value}\n")
+    parts.append("\n")
+    return "".join(parts)
+
+
+async def _convert_field_value(
+    owner: str, project_number: int, field_ref: str, raw_value: str
+) -> Tuple[str, Any, Optional[str]]:
+    """Resolve a field by ID or name and convert a tool input value for it.
+
+    Args:
+        owner: The GitHub organization or user name
+        project_number: The project number
+        field_ref: The field ID or field name
+        raw_value: The value as passed to the tool
+
+    Returns:
+        The field ID, the converted value and the field's dataType (None if unknown)
+
+    Raises:
+        ValueError: If the value does not fit the field type.
+    """
+    fields = await _cached_fields(owner, project_number)
+    field_info = fields.by_id.get(field_ref) or fields.resolve(field_ref)
+    if field_info is None:
+        # The field may have been created after the metadata was cached
+        _fields_cache.invalidate((owner, project_number))
+        fields = await _cached_fields(owner, project_number)
+        field_info = fields.by_id.get(field_ref) or fields.resolve(field_ref)
+
+    if field_info is None:
+        logger.warning(
+            f"Field {field_ref} not found in project {owner}/{project_number}. Sending value as-is."
+        )
+        return field_ref, raw_value, None
+
+    data_type = field_info.get("data_type")
+    parser = _FIELD_VALUE_PARSERS.get(data_type)
+    value = parser(field_info, raw_value) if parser is not None else raw_value
+    return field_info["id"], value, data_type
+
+
 # --- Tool definitions ---
 
 
@@ -50,20 +413,22 @@ async def list_projects(owner: str) -> str:
         A formatted string with project details
     """
     try:
-        projects = await github_client.get_projects(owner)
+        projects = await _fetch_projects(owner)
 
         if not projects:
             return f"No projects found for {owner}"
 
-        result = f"Projects for {owner}:\n\n"
+        parts = [f"Projects for {owner}:\n\n"]
         for project in projects:
-            result += f"- ID: {project['id']}\n"
-            result += f"  Number: {project['number']}\n"
-            result += f"  Title: {project['title']}\n"
-            result += f"  URL: {project['url']}\n"
-            result += "\n"
+            parts.append(
+                f"- ID: {project['id']}\n"
+                f"  Number: {project['number']}\n"
+                f"  Title: {project['title']}\n"
+                f"  URL: {project['url']}\n"
+                "\n"
+            )
 
-        return result
+        return "".join(parts)
     except GitHubClientError as e:
         logger.error(f"Error listing projects for {owner}: {e}")
         return f"Error: Could not list projects for {owner}. Details: {e}"
@@ -85,29 +450,33 @@ async def get_project_fields(owner: str, project_number: int) -> str:
         fields_details = await github_client.get_project_fields_details(
             owner, project_number
         )
+        # Always show fresh data here, but let later lookups reuse it
+        _fields_cache.put((owner, project_number), _index_fields(fields_details))
 
         if not fields_details:
             return f"No fields found for project #{project_number} in {owner}"
 
-        result = f"Fields for project #{project_number} in {owner}:\n\n"
+        parts = [f"Fields for project #{project_number} in {owner}:\n\n"]
         for field_name, details in fields_details.items():
-            result += f"- Name: {field_name}\n"
-            result += f"  ID: {details['id']}\n"
-            result += f"  Type: {details['type']}\n"
+            parts.append(
+                f"- Name: {field_name}\n"
+                f"  ID: {details['id']}\n"
+                f"  Type: {details['type']}\n"
+            )
 
             # Show options if it's a SingleSelect field
             if details["type"] == "ProjectV2SingleSelectField" and details.get(
                 "options"
             ):
-                result += "  Options (Name: ID):\n"
+                parts.append("  Options (Name: ID):\n")
                 for opt_name, opt_id in details["options"].items():
-                    result += f"    - {opt_name}: {opt_id}\n"
+                    parts.append(f"    - {opt_name}: {opt_id}\n")
 
             # TODO: Add similar display for Iteration fields if needed
 
-            result += "\n"
+            parts.append("\n")
 
-        return result
+        return "".join(parts)
     except GitHubClientError as e:
         logger.error(f"Error getting fields for project {owner}/{project_number}: {e}")
         return f"Error: Could not get fields for project {owner}/{project_number}. Details: {e}"
@@ -128,33 +497,89 @@ async def get_project_items(
     Args:
         owner: The GitHub organization or user name
         project_number: The project number
-        limit: Maximum number of items to return (default: 50). When filtering, the system automatically fetches more items to improve efficiency.
+        limit: Maximum number of items to return (default: 50). When filtering, the system automatically fetches more items to improve efficiency and keeps reading further pages until enough matches are found.
         state: Optional state filter (e.g., "OPEN", "CLOSED"). Applies to Issues/PRs.
         filter_field_name: Optional custom field name to filter by (e.g., "Status"). Currently supports SingleSelect and Iteration fields.
         filter_field_value: Optional custom field value to filter by (e.g., "In Development"). Uses case-insensitive matching.
-        cursor: Optional cursor for pagination. Use value from previous results to get next page.
+        cursor: Optional cursor for pagination. Use the "cursor" value from the <pagination> line of previous results to get the next page.
 
     Returns:
         A formatted string with item details.
     """
+    key = (
+        owner,
+        project_number,
+        limit,
+        state,
+        filter_field_name,
+        filter_field_value,
+        cursor,
+    )
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_project_items(*key))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.debug(f"Joining in-flight get_project_items call for {key}")
+    # Shield so a cancelled caller does not cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+async def _collect_item_pages(
+    owner: str,
+    project_number: int,
+    limit: int,
+    state: Optional[str],
+    filter_field_name: Optional[str],
+    filter_field_value: Optional[str],
+    cursor: Optional[str],
+    fields_details: Optional[Dict[str, Dict[str, Any]]],
+) -> Tuple[List[str], int, Dict[str, Any]]:
+    """Format item pages as they arrive, returning (parts, item count, last pageInfo)."""
+    parts: List[str] = []
+    item_count = 0
+    page_info: Dict[str, Any] = {}
+    async for page in github_client.iter_project_item_pages(
+        owner,
+        project_number,
+        limit,
+        state,
+        filter_field_name,
+        filter_field_value,
+        cursor,
+        fields_details,
+        max_pages=_MAX_ITEM_PAGES,
+    ):
+        if "fields" in page:
+            _fields_cache.put((owner, project_number), _index_fields(page["fields"]))
+        page_info = page["pageInfo"]
+        item_count += len(page["items"])
+        parts.extend(_format_item(item) for item in page["items"])
+    return parts, item_count, page_info
+
+
+async def _fetch_project_items(
+    owner: str,
+    project_number: int,
+    limit: int,
+    state: Optional[str],
+    filter_field_name: Optional[str],
+    filter_field_value: Optional[str],
+    cursor: Optional[str],
+) -> str:
+    """Fetch and format one get_project_items response (see the tool docstring)."""
     if state and filter_field_name:
         return "Error: Cannot filter by both 'state' and a custom field ('filter_field_name') simultaneously."
 
     try:
-        result = await github_client.get_project_items(
-            owner,
-            project_number,
-            limit,
-            state,
-            filter_field_name,
-            filter_field_value,
-            cursor,
-        )
-
-        items = result["items"]
-        page_info = result["pageInfo"]
-        has_next_page = page_info.get("hasNextPage", False)
-        end_cursor = page_info.get("endCursor")
+        # On a cold cache the client fetches the fields along with the first page
+        fields_details = None
+        fields_key = (owner, project_number)
+        if filter_field_name and filter_field_value:
+            cached = _fields_cache.get(fields_key)
+            if cached is not None:
+                fields_details = cached.by_name
 
         filter_desc = ""
         if state:
@@ -166,7 +591,37 @@ async def get_project_items(
         if cursor:
             pagination_desc = " (continued)"
 
-        if not items:
+        parts = [
+            f"Items in project #{project_number} for {owner}{filter_desc}{pagination_desc}:\n\n"
+        ]
+        item_args = (
+            owner,
+            project_number,
+            limit,
+            state,
+            filter_field_name,
+            filter_field_value,
+            _decode_cursor(cursor) if cursor else None,
+        )
+        try:
+            item_parts, item_count, page_info = await _collect_item_pages(
+                *item_args, fields_details
+            )
+        except ValueError as e:
+            if fields_details is None:
+                raise
+            # The cached fields may predate a newly added field, option or iteration
+            logger.info(f"Filter failed against cached fields ({e}), refreshing them")
+            _fields_cache.invalidate(fields_key)
+            item_parts, item_count, page_info = await _collect_item_pages(
+                *item_args, None
+            )
+        parts.extend(item_parts)
+
+        has_next_page = page_info.get("hasNextPage", False)
+        end_cursor = page_info.get("endCursor")
+
+        if not item_count:
             if cursor:
                 return f"No more items found in project #{project_number} for {owner}{filter_desc}"
             else:
@@ -174,16 +629,8 @@ async def get_project_items(
                 if filter_field_name and filter_field_value:
                     # Get available fields and options to help debug
                     try:
-                        fields_details = await github_client.get_project_fields_details(
-                            owner, project_number
-                        )
-                        field_info = None
-
-                        # Try to find the field case-insensitively
-                        for fname, finfo in fields_details.items():
-                            if fname.lower() == filter_field_name.lower():
-                                field_info = finfo
-                                break
+                        fields = await _cached_fields(owner, project_number)
+                        field_info = fields.resolve(filter_field_name)
 
                         if field_info:
                             field_type = field_info.get("type", "Unknown")
@@ -191,83 +638,55 @@ async def get_project_items(
                                 available_options = list(
                                     field_info.get("options", {}).keys()
                                 )
-                                return (
-                                    f"No items found in project #{project_number} for {owner}{filter_desc}\n\n"
-                                    f"Debug info:\n"
-                                    f"- Found field '{filter_field_name}' with type '{field_type}'\n"
-                                    f"- Available options: {available_options}\n"
-                                    f"- Note: Searched up to {limit} items. If the project has many items, some '{filter_field_value}' items might be beyond this scope.\n"
-                                    f"- Tip: Try increasing the limit parameter or check if the field value spelling is correct."
+                                return _NO_ITEMS_DEBUG_TMPL.format(
+                                    pn=project_number,
+                                    o=owner,
+                                    fd=filter_desc,
+                                    fn=filter_field_name,
+                                    ft=field_type,
+                                    kind="options",
+                                    values=available_options,
+                                    pages=_MAX_ITEM_PAGES,
+                                    lim=limit,
+                                    fv=filter_field_value,
                                 )
                             elif field_type == "ProjectV2IterationField":
                                 available_iterations = list(
                                     field_info.get("iterations", {}).keys()
                                 )
-                                return (
-                                    f"No items found in project #{project_number} for {owner}{filter_desc}\n\n"
-                                    f"Debug info:\n"
-                                    f"- Found field '{filter_field_name}' with type '{field_type}'\n"
-                                    f"- Available iterations: {available_iterations}\n"
-                                    f"- Note: Searched up to {limit} items. If the project has many items, some '{filter_field_value}' items might be beyond this scope.\n"
-                                    f"- Tip: Try increasing the limit parameter or check if the field value spelling is correct."
+                                return _NO_ITEMS_DEBUG_TMPL.format(
+                                    pn=project_number,
+                                    o=owner,
+                                    fd=filter_desc,
+                                    fn=filter_field_name,
+                                    ft=field_type,
+                                    kind="iterations",
+                                    values=available_iterations,
+                                    pages=_MAX_ITEM_PAGES,
+                                    lim=limit,
+                                    fv=filter_field_value,
                                 )
                     except Exception as e:
                         logger.warning(
                             f"Could not get additional field details for debug info: {e}"
                         )
 
-                return f"No items found in project #{project_number} for {owner}{filter_desc}\n\nNote: If the project has many items, try increasing the limit parameter to search more thoroughly."
-
-        # Format results
-        result = f"Items in project #{project_number} for {owner}{filter_desc}{pagination_desc}:\n\n"
-        for item in items:
-            content = item.get("content", {})
-            result += f"- Item ID: {item['id']}\n"
-            item_type = content.get("__typename")
-            repo_info = content.get("repository", {})
-            repo_str = (
-                f"{repo_info.get('owner', {}).get('login')}/{repo_info.get('name')}"
-                if repo_info
-                else "N/A"
-            )
-
-            if item_type == "Issue":
-                result += f"  Type: Issue #{content.get('number')} ({repo_str})\n"
-                result += f"  Title: {content.get('title')}\n"
-                result += f"  State: {content.get('state')}\n"
-                result += f"  URL: {content.get('url')}\n"
-            elif item_type == "PullRequest":
-                result += f"  Type: PR #{content.get('number')} ({repo_str})\n"
-                result += f"  Title: {content.get('title')}\n"
-                result += f"  State: {content.get('state')}\n"
-                result += f"  URL: {content.get('url')}\n"
-            elif item_type == "DraftIssue":
-                # Include body for draft issues if available (check if client fetches it)
-                body = content.get("body", "")  # Assuming client might fetch body
-                result += f"  Type: Draft Issue ID: {content.get('id')}\n"
-                result += f"  Title: {content.get('title')}\n"
-                if body:
-                    result += f"  Body: {body[:100]}...\n"  # Show preview
-            else:
-                result += f"  Type: {item_type or 'Unknown'}\n"
-                result += f"  Content: {json.dumps(content)}\n"
-
-            # Show processed field values
-            if item.get("fieldValues"):
-                result += "  Field Values:\n"
-                for field_name, value in item["fieldValues"].items():
-                    result += f"    - {field_name}: {value}\n"
-            result += "\n"
+                return _NO_ITEMS_TMPL.format(
+                    pn=project_number, o=owner, fd=filter_desc
+                )
 
         # Add pagination info
         if has_next_page and end_cursor:
-            result += "\n--- Pagination ---\n"
-            result += "More items available: Yes\n"
-            result += f"Next page cursor: {end_cursor}\n"
-            result += "To get the next page, use the cursor parameter:\n"
-            result += f"cursor: {end_cursor}\n"
+            trailer = json.dumps(
+                {"hasNext": True, "cursor": _encode_cursor(end_cursor)},
+                separators=(",", ":"),
+            )
+            parts.append(
+                f"\n<pagination>{trailer}</pagination>\n"
+                "Pass the cursor value as the cursor parameter to get the next page.\n"
+            )
 
-        return result
+        return "".join(parts)
     except (
         GitHubClientError,
         ValueError,
@@ -295,9 +714,8 @@ async def create_issue(owner: str, repo: str, title: str, body: str = "", assign
     try:
         issue = await github_client.create_issue(owner, repo, title, body, assignees)
         assignees_info = ""
-        if assignees and issue.get('assignees', {}).get('nodes'):
-            assigned_users = [user['login'] for user in issue['assignees']['nodes']]
-            assignees_info = f"Assignees: {', '.join(assigned_users)}\n"
+        if nodes := (issue.get('assignees') or {}).get('nodes'):
+            assignees_info = f"Assignees: {', '.join(user['login'] for user in nodes)}\n"
         
         return (
             f"Issue created successfully!\n\n"
@@ -357,8 +775,8 @@ async def update_project_item_field(
     - Text fields: Provide text value
     - Date fields: Provide date in YYYY-MM-DD format  
     - Number fields: Provide numeric value
-    - Single select fields: Provide option ID
-    - Iteration fields: Provide iteration ID
+    - Single select fields: Provide option ID (or option name)
+    - Iteration fields: Provide iteration ID (or iteration title)
 
     Note: Labels fields and Issue Type fields are special - they cannot be modified
     through project field updates as they are properties of the Issue itself.
@@ -369,37 +787,24 @@ async def update_project_item_field(
         owner: The GitHub organization or user name
         project_number: The project number
         item_id: The ID of the item to update
-        field_id: The ID of the field to update
+        field_id: The ID of the field to update (the field name is also accepted)
         field_value: The new value for the field (format depends on field type)
 
     Returns:
         A confirmation message
     """
     try:
-        # The GitHub client's update method expects the raw value, not just string
-        # We might need a way to parse field_value based on field_id or context
-        # For now, we pass the string directly, but this might fail for non-text fields.
-        # A better implementation would fetch field info first to determine expected type.
-        logger.warning(
-            f"Attempting to update field {field_id} with value '{field_value}'. Type conversion might be needed."
+        field_id, parsed_value, data_type = await _convert_field_value(
+            owner, project_number, field_id, field_value
         )
 
-        # Attempt basic type inference (example - needs improvement)
-        parsed_value: Any = field_value
-        try:
-            parsed_value = float(field_value)
-            if parsed_value.is_integer():
-                parsed_value = int(parsed_value)
-        except ValueError:
-            # Check if looks like a date?
-            pass  # Keep as string if not obviously numeric
-
         result = await github_client.update_project_item_field(
             owner,
             project_number,
             item_id,
             field_id,
-            parsed_value,  # Pass potentially parsed value
+            parsed_value,
+            data_type,
         )
 
         return (
@@ -410,7 +815,65 @@ async def update_project_item_field(
         )
     except GitHubClientError as e:
         logger.error(f"Error updating field {field_id} for item {item_id}: {e}")
+        # The failure may come from stale field metadata (e.g. a removed option)
+        _fields_cache.invalidate((owner, project_number))
         return f"Error: Could not update field value. Details: {e}"
+    except ValueError as e:
+        logger.error(f"Invalid value '{field_value}' for field {field_id}: {e}")
+        return f"Error: Invalid value '{field_value}' for field {field_id}. Details: {e}"
+
+
+@mcp.tool()
+async def update_project_item_fields(
+    owner: str, project_number: int, item_id: str, field_values: Dict[str, str]
+) -> str:
+    """Update several field values of a project item in a single request.
+
+    Accepts the same value formats as update_project_item_field, e.g. setting
+    both a start and an end date field at once.
+
+    Args:
+        owner: The GitHub organization or user name
+        project_number: The project number
+        item_id: The ID of the item to update
+        field_values: Mapping of field ID (or field name) to its new value
+
+    Returns:
+        A confirmation message
+    """
+    try:
+        values: Dict[str, Any] = {}
+        data_types: Dict[str, Optional[str]] = {}
+        refs_by_id: Dict[str, str] = {}
+        for field_ref, field_value in field_values.items():
+            field_id, value, data_type = await _convert_field_value(
+                owner, project_number, field_ref, field_value
+            )
+            if field_id in refs_by_id:
+                raise ValueError(
+                    f"'{field_ref}' and '{refs_by_id[field_id]}' refer to the same field ({field_id})"
+                )
+            refs_by_id[field_id] = field_ref
+            values[field_id] = value
+            data_types[field_id] = data_type
+
+        await github_client.update_project_item_fields(
+            owner, project_number, item_id, values, data_types
+        )
+
+        return (
+            f"Successfully updated {len(values)} fields for item in project #{project_number}!\n"
+            f"Item ID: {item_id}\n"
+            + "".join(f"- {ref}: {value}\n" for ref, value in field_values.items())
+        )
+    except GitHubClientError as e:
+        logger.error(f"Error updating fields for item {item_id}: {e}")
+        # The failure may come from stale field metadata (e.g. a removed option)
+        _fields_cache.invalidate((owner, project_number))
+        return f"Error: Could not update field values. Details: {e}"
+    except ValueError as e:
+        logger.error(f"Invalid field value for item {item_id}: {e}")
+        return f"Error: Invalid field value. Details: {e}"
 
 
 @mcp.tool()
@@ -587,6 +1050,19 @@ async def update_issue_labels(owner: str, repo: str, issue_number: int, label_id
 
 
 # Main entry point function that can be imported
+async def _serve() -> None:
+    """Run the MCP server, closing the shared HTTP client once it stops.
+
+    The client is closed here rather than in a FastMCP lifespan, which is
+    entered once per connection on SSE and would close the pool under the
+    sessions that follow.
+    """
+    try:
+        await mcp.run_async(transport="stdio")
+    finally:
+        await http_client.aclose()
+
+
 def main():
     """Main entry point for the GitHub Projects MCP server.
 
@@ -598,8 +1074,16 @@ def main():
         print("Error: GITHUB_TOKEN environment variable is required")
         exit(1)
 
+    # Use the faster libuv-based event loop when it is installed
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+
     # Run the MCP server
-    mcp.run(transport="stdio")
+    asyncio.run(_serve())
 
 
 # Run the main function if executed directly
@@ -10,66 +10,157 @@ import os
 import sys
 import re
 import asyncio
-from src.github_projects_mcp.github_client import GitHubClient
+import inspect
+from pathlib import Path
+from src.github_projects_mcp.github_client import (
+    GitHubClient,
+    _F_PROJECT_ITEMS,
+    _M_UPDATE_ISSUE_LABELS,
+    _Q_GET_ISSUE_ID,
+)
+
+# Node ID prefix of ProjectV2 Labels fields
+_LABELS_FIELD_PREFIX = "PVTLSF_"
+
+_PASS = "✅ PASS"
+_FAIL = "❌ FAIL"
+
+SERVER_PATH = Path("src", "github_projects_mcp", "server.py")
+
+# Feature name -> string that marks it, per scanned source
+FRAGMENT_FEATURES = {
+    "labels_fragment": "ProjectV2ItemFieldLabelValue",
+    "issuetype_fragment": "issueType",
+}
+ITEMS_FEATURES = {
+    "labels_processing": 'fv_type == "ProjectV2ItemFieldLabelValue"',
+    "type_virtual_field": 'processed_values["Type"]',
+}
+SERVER_FEATURES = {
+    "labels_tool": "async def get_repository_labels",
+    "issue_types_tool": "async def get_repository_issue_types",
+    "tool_decorators": "@mcp.tool()",
+    "labels_doc": "Labels fields",
+    "issue_type_doc": "Issue Type",
+    "type_readonly_doc": "cannot be modified",
+    "update_field_tool": "update_project_item_field",
+}
+
+# (test name, required features, combiner, pass message, fail message)
+SERVER_TOOL_CHECKS = (
+    ("get_repository_labels tool", ("labels_tool",), all,
+     "Tool function found in source", "Tool function missing from source"),
+    ("get_repository_issue_types tool", ("issue_types_tool",), all,
+     "Tool function found in source", "Tool function missing from source"),
+    ("MCP tool decorators", ("tool_decorators",), all,
+     "MCP tool decorators found in source", "MCP tool decorators missing"),
+)
+DOCUMENTATION_CHECKS = (
+    ("Tool documentation - Labels", ("labels_doc",), all,
+     "Labels field documentation found", "Labels field documentation missing"),
+    ("Tool documentation - Type", ("issue_type_doc", "type_readonly_doc"), all,
+     "Type field limitation documentation found",
+     "Type field documentation missing or incorrect"),
+    ("update_project_item_field tool", ("update_field_tool",), all,
+     "Tool function found in source", "Tool function missing from source"),
+)
+
+_FRAGMENT_FEATURES_RE = re.compile("|".join(map(re.escape, FRAGMENT_FEATURES.values())))
+_ITEMS_FEATURES_RE = re.compile("|".join(map(re.escape, ITEMS_FEATURES.values())))
+_SERVER_FEATURES_RE = re.compile("|".join(map(re.escape, SERVER_FEATURES.values())))
 
 
 class TestLabelsAndTypes:
     """Test class for Labels and Type field functionality."""
+
+    __slots__ = (
+        "client",
+        "test_results",
+        "_get_project_items_src",
+        "_server_src",
+        "_sigs",
+        "_features",
+        "_passed_count",
+        "_total_count",
+    )
     
     def __init__(self):
         """Initialize the test with a GitHub client."""
         self.client = GitHubClient("Tu github token")
         self.test_results = []
+        self._passed_count = 0
+        self._total_count = 0
+
+        # inspect re-reads and re-parses the source file on every call, so do it once
+        self._get_project_items_src = inspect.getsource(self.client.get_project_items)
+        self._sigs = {
+            name: inspect.signature(getattr(self.client, name))
+            for name in ("get_repository_labels", "get_repository_issue_types")
+            if hasattr(self.client, name)
+        }
+        # Several tests scan server.py; read it once
+        self._server_src = (
+            SERVER_PATH.read_text(encoding="utf-8") if SERVER_PATH.exists() else None
+        )
+        self._features = self._scan_features()
+
+    def _scan_features(self):
+        """Detect every feature with one regex pass over each source."""
+        features = {}
+        for source, needles, pattern in (
+            (_F_PROJECT_ITEMS, FRAGMENT_FEATURES, _FRAGMENT_FEATURES_RE),
+            (self._get_project_items_src, ITEMS_FEATURES, _ITEMS_FEATURES_RE),
+            (self._server_src or "", SERVER_FEATURES, _SERVER_FEATURES_RE),
+        ):
+            hits = set(pattern.findall(source))
+            features.update((name, needle in hits) for name, needle in needles.items())
+        return features
     
     def log_test(self, test_name: str, passed: bool, message: str = ""):
         """Log a test result."""
-        status = "✅ PASS" if passed else "❌ FAIL"
-        result = f"{status}: {test_name}"
+        result = f"{(_FAIL, _PASS)[passed]}: {test_name}"
         if message:
             result += f" - {message}"
-        print(result)
-        self.test_results.append({
-            "test": test_name,
-            "passed": passed,
-            "message": message
-        })
+        sys.stdout.write(result + "\n")
+        self._total_count += 1
+        self._passed_count += passed
+        self.test_results.append((test_name, passed, message))
+    
+    def _run_server_checks(self, checks):
+        """Log one result per (test name, features, combiner, pass msg, fail msg) check."""
+        for test_name, features, combiner, pass_message, fail_message in checks:
+            passed = combiner(self._features[name] for name in features)
+            self.log_test(test_name, passed, pass_message if passed else fail_message)
     
     async def test_field_value_preparation(self):
         """Test the field value preparation logic for Labels field."""
         print("\n=== Testing Field Value Preparation ===")
         
         # Test case 1: Labels field with single label ID
-        try:
-            # This is a mock test since we can't easily test the private logic
-            # We'll test by checking if the field ID detection works
-            field_id = "PVTLSF_test123"  # Mock Labels field ID
-            
-            # The actual test would be in the update_project_item_field method
-            # For now, we verify the prefix detection logic exists
-            if field_id.startswith("PVTLSF_"):
-                self.log_test("Labels field ID detection", True, "PVTLSF_ prefix detected correctly")
-            else:
-                self.log_test("Labels field ID detection", False, "Failed to detect Labels field prefix")
-                
-        except Exception as e:
-            self.log_test("Labels field value preparation", False, f"Error: {str(e)}")
+        # This is a mock test since we can't easily test the private logic
+        # We'll test by checking if the field ID detection works
+        field_id = "PVTLSF_test123"  # Mock Labels field ID
+        
+        # The actual test would be in the update_project_item_field method
+        # For now, we verify the prefix detection logic exists
+        if field_id.startswith(_LABELS_FIELD_PREFIX):
+            self.log_test("Labels field ID detection", True, "PVTLSF_ prefix detected correctly")
+        else:
+            self.log_test("Labels field ID detection", False, "Failed to detect Labels field prefix")
     
     async def test_graphql_fragments(self):
         """Test that the GraphQL fragments include the new field types."""
         print("\n=== Testing GraphQL Fragment Updates ===")
         
         try:
-            # Test Labels fragment inclusion
-            # We'll check if the client has the updated fragment by looking at the method
-            import inspect
-            source = inspect.getsource(self.client.get_project_items)
+            # Test Labels fragment inclusion in the items query fragments
             
-            if "ProjectV2ItemFieldLabelValue" in source:
+            if self._features["labels_fragment"]:
                 self.log_test("Labels GraphQL fragment", True, "ProjectV2ItemFieldLabelValue fragment found")
             else:
                 self.log_test("Labels GraphQL fragment", False, "Labels fragment missing from query")
             
-            if "issueType" in source:
+            if self._features["issuetype_fragment"]:
                 self.log_test("IssueType GraphQL fragment", True, "issueType field found in content fragment")
             else:
                 self.log_test("IssueType GraphQL fragment", False, "issueType field missing from content fragment")
@@ -86,13 +177,11 @@ class TestLabelsAndTypes:
             self.log_test("get_repository_labels method", True, "Method exists")
             
             # Test method signature
-            import inspect
-            sig = inspect.signature(self.client.get_repository_labels)
-            params = list(sig.parameters.keys())
-            if 'owner' in params and 'repo' in params:
+            params = self._sigs["get_repository_labels"].parameters
+            if {'owner', 'repo'}.issubset(params):
                 self.log_test("get_repository_labels signature", True, "Has owner and repo parameters")
             else:
-                self.log_test("get_repository_labels signature", False, f"Wrong parameters: {params}")
+                self.log_test("get_repository_labels signature", False, f"Wrong parameters: {list(params)}")
         else:
             self.log_test("get_repository_labels method", False, "Method missing")
         
@@ -101,13 +190,11 @@ class TestLabelsAndTypes:
             self.log_test("get_repository_issue_types method", True, "Method exists")
             
             # Test method signature
-            import inspect
-            sig = inspect.signature(self.client.get_repository_issue_types)
-            params = list(sig.parameters.keys())
-            if 'owner' in params and 'repo' in params:
+            params = self._sigs["get_repository_issue_types"].parameters
+            if {'owner', 'repo'}.issubset(params):
                 self.log_test("get_repository_issue_types signature", True, "Has owner and repo parameters")
             else:
-                self.log_test("get_repository_issue_types signature", False, f"Wrong parameters: {params}")
+                self.log_test("get_repository_issue_types signature", False, f"Wrong parameters: {list(params)}")
         else:
             self.log_test("get_repository_issue_types method", False, "Method missing")
     
@@ -117,16 +204,14 @@ class TestLabelsAndTypes:
         
         try:
             # Test Labels field processing logic
-            import inspect
-            source = inspect.getsource(self.client.get_project_items)
             
-            if "ProjectV2ItemFieldLabelValue" in source:
+            if self._features["labels_processing"]:
                 self.log_test("Labels field processing", True, "Labels field type handling found")
             else:
                 self.log_test("Labels field processing", False, "Labels field processing missing")
             
             # Test Type field processing (should add Type as virtual field)
-            if 'processed_values["Type"]' in source:
+            if self._features["type_virtual_field"]:
                 self.log_test("Type field processing", True, "Type virtual field processing found")
             else:
                 self.log_test("Type field processing", False, "Type virtual field processing missing")
@@ -138,31 +223,12 @@ class TestLabelsAndTypes:
         """Test that the new MCP server tools exist."""
         print("\n=== Testing MCP Server Tools ===")
         
+        if self._server_src is None:
+            return self.log_test("Server file existence", False, "server.py file not found")
+        
         try:
-            # Check if the server file exists and contains the expected functions
-            server_file_path = os.path.join("src", "github_projects_mcp", "server.py")
-            if os.path.exists(server_file_path):
-                with open(server_file_path, 'r', encoding='utf-8') as f:
-                    server_content = f.read()
-                
-                # Check for new tool functions in the source code
-                if "async def get_repository_labels" in server_content:
-                    self.log_test("get_repository_labels tool", True, "Tool function found in source")
-                else:
-                    self.log_test("get_repository_labels tool", False, "Tool function missing from source")
-                
-                if "async def get_repository_issue_types" in server_content:
-                    self.log_test("get_repository_issue_types tool", True, "Tool function found in source")
-                else:
-                    self.log_test("get_repository_issue_types tool", False, "Tool function missing from source")
-                
-                if "@mcp.tool()" in server_content:
-                    self.log_test("MCP tool decorators", True, "MCP tool decorators found in source")
-                else:
-                    self.log_test("MCP tool decorators", False, "MCP tool decorators missing")
-            else:
-                self.log_test("Server file existence", False, "server.py file not found")
-                
+            # Check for new tool functions in the source code
+            self._run_server_checks(SERVER_TOOL_CHECKS)
         except Exception as e:
             self.log_test("Server tools test", False, f"Error: {str(e)}")
     
@@ -170,30 +236,11 @@ class TestLabelsAndTypes:
         """Test that the update_project_item_field tool documentation was updated."""
         print("\n=== Testing Tool Documentation Updates ===")
         
+        if self._server_src is None:
+            return self.log_test("Server file existence", False, "server.py file not found")
+        
         try:
-            # Check server file content directly
-            server_file_path = os.path.join("src", "github_projects_mcp", "server.py")
-            if os.path.exists(server_file_path):
-                with open(server_file_path, 'r', encoding='utf-8') as f:
-                    server_content = f.read()
-                
-                if "Labels fields" in server_content:
-                    self.log_test("Tool documentation - Labels", True, "Labels field documentation found")
-                else:
-                    self.log_test("Tool documentation - Labels", False, "Labels field documentation missing")
-                
-                if "Issue Type" in server_content and "cannot be modified" in server_content:
-                    self.log_test("Tool documentation - Type", True, "Type field limitation documentation found")
-                else:
-                    self.log_test("Tool documentation - Type", False, "Type field documentation missing or incorrect")
-                
-                if "update_project_item_field" in server_content:
-                    self.log_test("update_project_item_field tool", True, "Tool function found in source")
-                else:
-                    self.log_test("update_project_item_field tool", False, "Tool function missing from source")
-            else:
-                self.log_test("Server file existence", False, "server.py file not found")
-                
+            self._run_server_checks(DOCUMENTATION_CHECKS)
         except Exception as e:
             self.log_test("Tool documentation test", False, f"Error: {str(e)}")
     
@@ -202,25 +249,27 @@ class TestLabelsAndTypes:
         print("🧪 Starting Labels and Type Field Tests")
         print("=" * 50)
         
-        await self.test_field_value_preparation()
-        await self.test_graphql_fragments()
-        await self.test_helper_methods_exist()
-        await self.test_field_processing_logic()
-        await self.test_server_tools_exist()
-        await self.test_update_tool_documentation()
-        
-        # Test new issue label update functionality
-        await test_update_issue_labels()
-        await test_get_issue_node_id()
-        await test_server_update_issue_labels_tool()
+        # The tests are independent, so run them concurrently
+        await asyncio.gather(
+            self.test_field_value_preparation(),
+            self.test_graphql_fragments(),
+            self.test_helper_methods_exist(),
+            self.test_field_processing_logic(),
+            self.test_server_tools_exist(),
+            self.test_update_tool_documentation(),
+            # Test new issue label update functionality
+            test_update_issue_labels(),
+            test_get_issue_node_id(),
+            test_server_update_issue_labels_tool(self._server_src),
+        )
         
         # Summary
         print("\n" + "=" * 50)
         print("📊 Test Summary")
         print("=" * 50)
         
-        passed = sum(1 for result in self.test_results if result["passed"])
-        total = len(self.test_results)
+        passed = self._passed_count
+        total = self._total_count
         
         print(f"Total Tests: {total}")
         print(f"Passed: {passed}")
@@ -259,67 +308,33 @@ async def test_update_issue_labels():
     """Test updating issue labels directly."""
     print("Testing update_issue_labels...")
     
-    # Test the GraphQL mutation query structure
-    mutation = """
-    mutation UpdateIssueLabels($issueId: ID!, $labelIds: [ID!]!) {
-      updateIssue(input: {
-        id: $issueId,
-        labelIds: $labelIds
-      }) {
-        issue {
-          id
-          number
-          title
-          labels(first: 20) {
-            nodes {
-              id
-              name
-              color
-            }
-          }
-        }
-      }
-    }
-    """
-    
-    # Verify the mutation structure is correct
-    assert "updateIssue" in mutation
-    assert "labelIds" in mutation
-    assert "labels(first: 20)" in mutation
+    # Verify the mutation the client actually sends; explicit raises so the
+    # checks still run under python -O
+    for needle in ("updateIssue", "labelIds", "labels(first: 20)"):
+        if needle not in _M_UPDATE_ISSUE_LABELS:
+            raise AssertionError(f"UpdateIssueLabels mutation is missing {needle!r}")
     print("  ✓ GraphQL mutation structure is correct")
 
 async def test_get_issue_node_id():
     """Test getting issue node ID."""
     print("Testing get_issue_node_id...")
     
-    # Test the GraphQL query structure
-    query = """
-    query GetIssueId($owner: String!, $repo: String!, $issueNumber: Int!) {
-      repository(owner: $owner, name: $repo) {
-        issue(number: $issueNumber) {
-          id
-        }
-      }
-    }
-    """
-    
-    # Verify the query structure is correct
-    assert "repository" in query
-    assert "issue(number: $issueNumber)" in query
-    assert "id" in query
+    # Verify the query the client actually sends
+    for needle in ("repository", "issue(number: $issueNumber)", "id"):
+        if needle not in _Q_GET_ISSUE_ID:
+            raise AssertionError(f"GetIssueId query is missing {needle!r}")
     print("  ✓ GraphQL query structure is correct")
 
-async def test_server_update_issue_labels_tool():
+async def test_server_update_issue_labels_tool(content):
     """Test the server's update_issue_labels tool function."""
     print("Testing server update_issue_labels tool...")
     
     # This would be tested with actual server integration
     # For now, just verify the tool signature exists in server.py
-    with open("src/github_projects_mcp/server.py", "r") as f:
-        content = f.read()
-        assert "async def update_issue_labels" in content
-        assert "label_ids: str" in content
-        assert "issue_number: int" in content
+    assert content is not None, "server.py file not found"
+    assert "async def update_issue_labels" in content
+    assert "label_ids: str" in content
+    assert "issue_number: int" in content
     
     print("  ✓ Server tool function exists with correct signature")
 
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Test script for the value conversion, cursor and caching helpers of the
+GitHub Projects MCP Server.
+
+These are behaviour checks: GitHub API calls are replaced with in-process fakes,
+so no token or network access is needed.
+"""
+
+import os
+import re
+import sys
+import copy
+import json
+import asyncio
+
+# The server builds its GitHub client at import time and needs a token for it
+os.environ.setdefault("GITHUB_TOKEN", "test-token")
+
+from src.github_projects_mcp import server
+from src.github_projects_mcp.github_client import GitHubClient
+
+_PASS = "✅ PASS"
+_FAIL = "❌ FAIL"
+
+FIELDS = {
+    "Status": {
+        "id": "PVTSSF_status",
+        "type": "ProjectV2SingleSelectField",
+        "data_type": "SINGLE_SELECT",
+        "options": {"Todo": "opt_todo", "Done": "opt_done"},
+        "iterations": {},
+    },
+    "Due": {
+        "id": "PVTF_due",
+        "type": "ProjectV2Field",
+        "data_type": "DATE",
+        "options": {},
+        "iterations": {},
+    },
+    "Estimate": {
+        "id": "PVTF_estimate",
+        "type": "ProjectV2Field",
+        "data_type": "NUMBER",
+        "options": {},
+        "iterations": {},
+    },
+}
+
+
+class FakeProject:
+    """In-process stand-in for the GraphQL endpoint of a single project.
+
+    Every third item has Status=Done; the rest are Todo. Page cursors are the
+    item indexes as strings.
+    """
+
+    def __init__(self, item_count: int = 300):
+        self.options = {"Todo": "opt_todo", "Done": "opt_done"}
+        self.items = [
+            {
+                "id": f"PVTI_{i}",
+                "type": "DRAFT_ISSUE",
+                "fieldValues": {"nodes": [{
+                    "__typename": "ProjectV2ItemFieldSingleSelectValue",
+                    "name": "Done" if i % 3 == 0 else "Todo",
+                    "field": {"name": "Status"},
+                }]},
+                "content": {"__typename": "DraftIssue", "id": f"DI_{i}", "title": f"Item {i}"},
+            }
+            for i in range(item_count)
+        ]
+        self.queries = []
+
+    def install(self, client):
+        """Route the client's project ID lookups and queries to this fake."""
+        client.get_project_node_id = self.get_project_node_id
+        client.execute_query = self.execute_query
+
+    def matching_ids(self, status: str):
+        """IDs of the items whose Status is status."""
+        return [
+            item["id"] for item in self.items
+            if item["fieldValues"]["nodes"][0]["name"] == status
+        ]
+
+    async def get_project_node_id(self, owner, project_number):
+        return "PVT_project"
+
+    async def execute_query(self, query, variables=None):
+        self.queries.append(re.search(r"(?:query|mutation) (\w+)", query).group(1))
+        await asyncio.sleep(0)
+        start = int(variables["cursor"]) + 1 if variables.get("cursor") else 0
+        page = self.items[start:start + variables["first"]]
+        node = {"items": {
+            "pageInfo": {
+                "hasNextPage": start + len(page) < len(self.items),
+                "endCursor": str(start + len(page) - 1) if page else None,
+            },
+            "edges": [
+                {"cursor": str(start + i), "node": copy.deepcopy(item)}
+                for i, item in enumerate(page)
+            ],
+        }}
+        if self.queries[-1] == "GetProjectItemsWithFields":
+            node["fields"] = {"nodes": [{
+                "id": "PVTSSF_status",
+                "name": "Status",
+                "dataType": "SINGLE_SELECT",
+                "__typename": "ProjectV2SingleSelectField",
+                "options": [{"id": i, "name": n} for n, i in self.options.items()],
+            }]}
+        return {"node": node}
+
+
+def _item_ids(output: str):
+    """Item IDs listed in a get_project_items result."""
+    return re.findall(r"^- Item ID: (\S+)$", output, re.MULTILINE)
+
+
+def _next_cursor(output: str):
+    """Cursor from the <pagination> trailer of a get_project_items result, if any."""
+    match = re.search(r"<pagination>(.*?)</pagination>", output)
+    return json.loads(match.group(1))["cursor"] if match else None
+
+
+def _tool(tool):
+    """Return the coroutine function behind an @mcp.tool() object."""
+    return getattr(tool, "fn", tool)
+
+
+class TestServerHelpers:
+    """Behaviour checks for the server's helper functions."""
+
+    def __init__(self):
+        """Initialize the test with fake GitHub API calls."""
+        self.test_results = []
+        self._passed_count = 0
+        self._total_count = 0
+        self.fields_fetches = 0
+
+        async def fake_fields_details(owner, project_number):
+            self.fields_fetches += 1
+            return FIELDS
+
+        server.github_client.get_project_fields_details = fake_fields_details
+
+    def log_test(self, test_name: str, passed: bool, message: str = ""):
+        """Log a test result."""
+        result = f"{(_FAIL, _PASS)[passed]}: {test_name}"
+        if message:
+            result += f" - {message}"
+        sys.stdout.write(result + "\n")
+        self._total_count += 1
+        self._passed_count += passed
+        self.test_results.append((test_name, passed, message))
+
+    def check_raises(self, test_name: str, exc_type, func, *args):
+        """Log whether func(*args) raises exc_type."""
+        try:
+            result = func(*args)
+        except exc_type:
+            self.log_test(test_name, True, f"{exc_type.__name__} raised")
+        else:
+            self.log_test(test_name, False, f"Returned {result!r}")
+
+    async def test_value_parsers(self):
+        """Test the per-dataType value parsers."""
+        print("\n=== Testing Field Value Parsers ===")
+
+        value = server._parse_number({}, "3")
+        self.log_test("NUMBER integer", value == 3 and isinstance(value, int), f"Got {value!r}")
+        value = server._parse_number({}, "2.5")
+        self.log_test("NUMBER float", value == 2.5 and isinstance(value, float), f"Got {value!r}")
+        self.check_raises("NUMBER invalid", ValueError, server._parse_number, {}, "three")
+        for raw in ("nan", "inf", "-inf"):
+            self.check_raises(f"NUMBER {raw} rejected", ValueError, server._parse_number, {}, raw)
+
+        value = server._parse_date({}, "2024-01-05")
+        self.log_test("DATE valid", value == "2024-01-05", f"Got {value!r}")
+        self.check_raises("DATE invalid", ValueError, server._parse_date, {}, "05/01/2024")
+
+        value = server._parse_option(FIELDS["Status"], "Done")
+        self.log_test("Option name to ID", value == "opt_done", f"Got {value!r}")
+        value = server._parse_option(FIELDS["Status"], "opt_todo")
+        self.log_test("Option ID passthrough", value == "opt_todo", f"Got {value!r}")
+
+    async def test_convert_field_value(self):
+        """Test field resolution and conversion in _convert_field_value."""
+        print("\n=== Testing Field Value Conversion ===")
+
+        result = await server._convert_field_value("conv", 1, "estimate", "4")
+        self.log_test(
+            "Field by name (case-insensitive)",
+            result == ("PVTF_estimate", 4, "NUMBER"),
+            f"Got {result!r}",
+        )
+        result = await server._convert_field_value("conv", 1, "PVTSSF_status", "Todo")
+        self.log_test(
+            "Field by ID with option name",
+            result == ("PVTSSF_status", "opt_todo", "SINGLE_SELECT"),
+            f"Got {result!r}",
+        )
+
+        fetches_before = self.fields_fetches
+        result = await server._convert_field_value("conv", 1, "PVTF_unknown", "raw")
+        self.log_test(
+            "Unknown field fallback",
+            result == ("PVTF_unknown", "raw", None)
+            and self.fields_fetches == fetches_before + 1,
+            f"Got {result!r} after {self.fields_fetches - fetches_before} refresh(es)",
+        )
+
+        try:
+            await server._convert_field_value("conv", 1, "Due", "tomorrow")
+        except ValueError:
+            self.log_test("Invalid value for known field", True, "ValueError raised")
+        else:
+            self.log_test("Invalid value for known field", False, "No error raised")
+
+    async def test_cursor_codec(self):
+        """Test the page token round trip and raw cursor passthrough."""
+        print("\n=== Testing Cursor Encoding ===")
+
+        raw = "Y3Vyc29yOnYyOpHOAAAAAQ=="
+        token = server._encode_cursor(raw)
+        self.log_test(
+            "Cursor round trip",
+            token != raw and server._decode_cursor(token) == raw,
+            f"Token {token!r}",
+        )
+        decoded = server._decode_cursor(raw)
+        self.log_test("Raw cursor passthrough", decoded == raw, f"Got {decoded!r}")
+        decoded = server._decode_cursor("not a cursor!")
+        self.log_test("Non-base64 cursor passthrough", decoded == "not a cursor!", f"Got {decoded!r}")
+
+    async def test_ttl_cache(self):
+        """Test loading, expiry, eviction and lock cleanup of _AsyncTTLCache."""
+        print("\n=== Testing TTL Cache ===")
+
+        loads = 0
+
+        async def loader():
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0)
+            return loads
+
+        cache = server._AsyncTTLCache(maxsize=2, ttl=60)
+        values = await asyncio.gather(*(cache.get_or_load("a", loader) for _ in range(5)))
+        self.log_test(
+            "Concurrent misses load once",
+            loads == 1 and values == [1] * 5,
+            f"{loads} load(s), values {values}",
+        )
+
+        cache.put("b", "b")
+        cache.put("c", "c")
+        self.log_test("LRU eviction", cache.get("a") is None and cache.get("c") == "c")
+
+        expired = server._AsyncTTLCache(maxsize=2, ttl=0)
+        expired.put("a", "stale")
+        self.log_test("Expired entries are dropped", expired.get("a") is None)
+
+        async def failing_loader():
+            raise RuntimeError("lookup failed")
+
+        try:
+            await cache.get_or_load("missing", failing_loader)
+        except RuntimeError:
+            pass
+        self.log_test(
+            "Locks released after load",
+            not cache._locks,
+            f"Remaining locks: {list(cache._locks)}",
+        )
+
+    async def test_batched_field_update(self):
+        """Test the aliased mutation built by update_project_item_fields."""
+        print("\n=== Testing Batched Field Updates ===")
+
+        client = GitHubClient("test-token")
+        sent = []
+
+        async def fake_node_id(owner, project_number):
+            return "PVT_project"
+
+        async def fake_execute(query, variables=None):
+            sent.append((query, variables))
+            return {
+                f"update{i}": {"projectV2Item": {"id": "PVTI_item"}}
+                for i in range(len(variables) // 2)
+            }
+
+        client.get_project_node_id = fake_node_id
+        client.execute_query = fake_execute
+        await client.update_project_item_fields(
+            "o",
+            1,
+            "PVTI_item",
+            {"PVTF_due": "2024-01-05", "PVTF_estimate": 4},
+            {"PVTF_due": "DATE", "PVTF_estimate": "NUMBER"},
+        )
+        await client.aclose()
+
+        query, variables = sent[0] if sent else ("", {})
+        self.log_test(
+            "One request for all fields",
+            len(sent) == 1 and "update0:" in query and "update1:" in query,
+            f"{len(sent)} request(s)",
+        )
+        expected = {
+            "projectId": "PVT_project",
+            "itemId": "PVTI_item",
+            "fieldId0": "PVTF_due",
+            "value0": {"date": "2024-01-05"},
+            "fieldId1": "PVTF_estimate",
+            "value1": {"number": 4.0},
+        }
+        self.log_test("Mutation variables", variables == expected, f"Got {variables!r}")
+
+        result = await _tool(server.update_project_item_fields)(
+            "conv", 1, "PVTI_item", {"PVTF_due": "2024-01-05", "Due": "2024-01-06"}
+        )
+        self.log_test(
+            "Duplicate field refs rejected",
+            result.startswith("Error: Invalid field value") and "same field" in result,
+            result,
+        )
+
+    async def test_filtered_pagination(self):
+        """Test that following a filtered read's cursors returns every match once."""
+        print("\n=== Testing Filtered Pagination ===")
+
+        backend = FakeProject()
+        backend.install(server.github_client)
+        get_items = _tool(server.get_project_items)
+
+        seen = []
+        cursor = None
+        for _ in range(20):  # Guard against a cursor that never runs out
+            output = await get_items(
+                "paging", 1, limit=50, filter_field_name="Status",
+                filter_field_value="Done", cursor=cursor,
+            )
+            seen.extend(_item_ids(output))
+            cursor = _next_cursor(output)
+            if cursor is None:
+                break
+
+        expected = backend.matching_ids("Done")
+        self.log_test(
+            "Every filtered match returned once",
+            seen == expected,
+            f"{len(seen)} returned ({len(set(seen))} unique) of {len(expected)} matches",
+        )
+
+    async def test_fields_fetching(self):
+        """Test how filtered reads fetch and refresh the project fields."""
+        print("\n=== Testing Filtered Read Field Fetching ===")
+
+        get_items = _tool(server.get_project_items)
+        fetches_before = self.fields_fetches
+
+        backend = FakeProject()
+        backend.install(server.github_client)
+        output = await get_items(
+            "cold", 1, limit=5, filter_field_name="Status", filter_field_value="Done"
+        )
+        cached = server._fields_cache.get(("cold", 1))
+        self.log_test(
+            "Cold filter sends one fused query",
+            backend.queries == ["GetProjectItemsWithFields"] and len(_item_ids(output)) == 5,
+            f"Queries {backend.queries}",
+        )
+        self.log_test(
+            "Fused query fills the fields cache",
+            cached is not None and cached.by_name["Status"]["options"].get("Done") == "opt_done",
+        )
+
+        # Cached fields from before the Done option was added to the project
+        stale_status = dict(FIELDS["Status"], options={"Todo": "opt_todo"})
+        server._fields_cache.put(("stale", 1), server._index_fields({"Status": stale_status}))
+        backend = FakeProject()
+        backend.install(server.github_client)
+        output = await get_items(
+            "stale", 1, limit=5, filter_field_name="Status", filter_field_value="Done"
+        )
+        cached = server._fields_cache.get(("stale", 1))
+        self.log_test(
+            "Stale cached option refreshes once",
+            backend.queries == ["GetProjectItemsWithFields"] and len(_item_ids(output)) == 5,
+            f"Queries {backend.queries}",
+        )
+        self.log_test(
+            "Refresh replaces the stale fields",
+            cached is not None and "Done" in cached.by_name["Status"]["options"],
+        )
+        self.log_test(
+            "No separate fields lookups",
+            self.fields_fetches == fetches_before,
+            f"{self.fields_fetches - fetches_before} lookup(s)",
+        )
+
+    async def test_request_coalescing(self):
+        """Test that identical concurrent get_project_items calls share one fetch."""
+        print("\n=== Testing Request Coalescing ===")
+
+        backend = FakeProject()
+        backend.install(server.github_client)
+        get_items = _tool(server.get_project_items)
+
+        outputs = await asyncio.gather(*(get_items("coalesce", 1, limit=5) for _ in range(5)))
+        self.log_test(
+            "Identical calls send one set of requests",
+            backend.queries == ["GetProjectItems"],
+            f"Queries {backend.queries}",
+        )
+        self.log_test(
+            "Identical calls get the same result",
+            len(set(outputs)) == 1 and len(_item_ids(outputs[0])) == 5,
+        )
+        self.log_test("In-flight calls cleared", not server._inflight, f"Remaining: {list(server._inflight)}")
+
+    async def run_all_tests(self):
+        """Run all tests."""
+        print("🧪 Starting Server Helper Tests")
+        print("=" * 50)
+
+        await self.test_value_parsers()
+        await self.test_convert_field_value()
+        await self.test_cursor_codec()
+        await self.test_ttl_cache()
+        await self.test_batched_field_update()
+        await self.test_filtered_pagination()
+        await self.test_fields_fetching()
+        await self.test_request_coalescing()
+
+        # Summary
+        print("\n" + "=" * 50)
+        print("📊 Test Summary")
+        print("=" * 50)
+
+        passed = self._passed_count
+        total = self._total_count
+
+        print(f"Total Tests: {total}")
+        print(f"Passed: {passed}")
+        print(f"Failed: {total - passed}")
+        print(f"Success Rate: {(passed/total)*100:.1f}%")
+
+        return passed == total
+
+
+async def main():
+    """Main test function."""
+    tester = TestServerHelpers()
+    success = await tester.run_all_tests()
+
+    if success:
+        print("\n🎉 All server helper tests passed!")
+    else:
+        print("\n🔧 Please fix the failing tests.")
+
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    sys.exit(exit_code)